@@ -2,36 +2,64 @@
 Blend Inspector - Extract metadata from .blend files via Blender headless.
 
 Usage: blender -b scene.blend -P blend_inspector.py
+       blender -b -P blend_inspector.py -- --serve
 
 Outputs a JSON line prefixed with BLEND_INSPECTOR_JSON: to stdout.
 The prefix allows reliable parsing since Blender prints its own startup messages.
+
+With --serve, Blender stays running and reads one .blend path per line from
+stdin, answering each with a BLEND_INSPECTOR_JSON: line (or a
+BLEND_INSPECTOR_ERROR: line if the file can't be opened). This saves the
+Blender startup cost per file when inspecting a batch.
 """
 import bpy
 import json
 import sys
 
-metadata = {
-    "file": bpy.data.filepath,
-    "job_name": bpy.path.basename(bpy.data.filepath).replace(".blend", ""),
-    "blender_version": f"{bpy.app.version[0]}.{bpy.app.version[1]}",
-    "scenes": [],
-}
-
-for scene in bpy.data.scenes:
-    scene_data = {
-        "name": scene.name,
-        "frame_start": scene.frame_start,
-        "frame_end": scene.frame_end,
-        "frame_step": scene.frame_step,
-        "render_engine": scene.render.engine,
-        "resolution_x": scene.render.resolution_x,
-        "resolution_y": scene.render.resolution_y,
-        "output_path": scene.render.filepath,
-        "output_format": scene.render.image_settings.file_format,
-        "view_layers": [{"name": vl.name, "use": vl.use} for vl in scene.view_layers],
-        "use_nodes": scene.use_nodes,
+
+def collect_metadata():
+    name = bpy.path.basename(bpy.data.filepath)
+    metadata = {
+        "file": bpy.data.filepath,
+        "job_name": name[:-6] if name.lower().endswith(".blend") else name,
+        "blender_version": f"{bpy.app.version[0]}.{bpy.app.version[1]}",
+        "scenes": [],
     }
-    metadata["scenes"].append(scene_data)
 
-print("BLEND_INSPECTOR_JSON:" + json.dumps(metadata))
+    for scene in bpy.data.scenes:
+        scene_data = {
+            "name": scene.name,
+            "frame_start": scene.frame_start,
+            "frame_end": scene.frame_end,
+            "frame_step": scene.frame_step,
+            "render_engine": scene.render.engine,
+            "resolution_x": scene.render.resolution_x,
+            "resolution_y": scene.render.resolution_y,
+            "output_path": scene.render.filepath,
+            "output_format": scene.render.image_settings.file_format,
+            "view_layers": [{"name": vl.name, "use": vl.use} for vl in scene.view_layers],
+            "use_nodes": scene.use_nodes,
+        }
+        metadata["scenes"].append(scene_data)
+    return metadata
+
+
+def serve():
+    # Paths arrive UTF-8 encoded regardless of the console code page
+    for raw in sys.stdin.buffer:
+        filepath = raw.decode("utf-8", errors="replace").strip()
+        if not filepath:
+            continue
+        try:
+            bpy.ops.wm.open_mainfile(filepath=filepath)
+            print("BLEND_INSPECTOR_JSON:" + json.dumps(collect_metadata()), flush=True)
+        except Exception as e:
+            print("BLEND_INSPECTOR_ERROR:" + str(e).replace("\n", " "), flush=True)
+
+
+script_args = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+if "--serve" in script_args:
+    serve()
+else:
+    print("BLEND_INSPECTOR_JSON:" + json.dumps(collect_metadata()))
 sys.exit(0)
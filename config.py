@@ -1,50 +1,75 @@
 """
 Centralized configuration loader.
-Loads environment variables from .env and exposes simple SETTINGS and convenience variables.
+Loads environment variables from .env and exposes a frozen SETTINGS object and convenience variables.
 Also provides CGRU initialization helper to populate cgruconfig.VARS and adjust sys.path when `CGRU_LOCATION` is set.
 """
 from dotenv import load_dotenv
+from dataclasses import dataclass, field
+from typing import Optional
 import os
 import sys
 import logging
 
 load_dotenv()
 
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """Settings pulled from the environment, read once at import."""
+    kitsu_api_url: str
+    kitsu_user: str
+    kitsu_password: str = field(repr=False)
+    kitsu_default_prod: str
+    afanasy_server: str
+    afanasy_port: Optional[int]
+    cgru_location: str
+    blender_path: str
+    environment: str
+    log_level: str
+
+
 # Basic settings pulled from environment
-SETTINGS = {
-    'KITSU_API_URL': os.getenv('KITSU_API_URL', ''),
-    'KITSU_USER': os.getenv('KITSU_USER', ''),
-    'KITSU_PASSWORD': os.getenv('KITSU_PASSWORD', ''),
-    'KITSU_DEFAULT_PROD': os.getenv('KITSU_DEFAULT_PROD', ''),
-    'AFANASY_SERVER': os.getenv('AFANASY_SERVER', ''),
-    'AFANASY_PORT': int(os.getenv('AFANASY_PORT', 0)) if os.getenv('AFANASY_PORT') else None,
-    'CGRU_LOCATION': os.getenv('CGRU_LOCATION', ''),
-    'BLENDER_PATH': os.getenv('BLENDER_PATH', ''),
-    'ENVIRONMENT': os.getenv('ENVIRONMENT', 'development'),
-    'LOG_LEVEL': os.getenv('LOG_LEVEL', 'INFO')
-}
+SETTINGS = Settings(
+    kitsu_api_url=os.getenv('KITSU_API_URL', ''),
+    kitsu_user=os.getenv('KITSU_USER', ''),
+    kitsu_password=os.getenv('KITSU_PASSWORD', ''),
+    kitsu_default_prod=os.getenv('KITSU_DEFAULT_PROD', ''),
+    afanasy_server=os.getenv('AFANASY_SERVER', ''),
+    afanasy_port=int(os.getenv('AFANASY_PORT', 0)) if os.getenv('AFANASY_PORT') else None,
+    cgru_location=os.getenv('CGRU_LOCATION', ''),
+    blender_path=os.getenv('BLENDER_PATH', ''),
+    environment=os.getenv('ENVIRONMENT', 'development'),
+    log_level=os.getenv('LOG_LEVEL', 'INFO'),
+)
 
 # Backwards-compatible module-level names
-KITSU_API_URL = SETTINGS['KITSU_API_URL']
-KITSU_USER = SETTINGS['KITSU_USER']
-KITSU_PASSWORD = SETTINGS['KITSU_PASSWORD']
-KITSU_DEFAULT_PROD = SETTINGS['KITSU_DEFAULT_PROD']
-AFANASY_SERVER = SETTINGS['AFANASY_SERVER']
-AFANASY_PORT = SETTINGS['AFANASY_PORT']
-CGRU_LOCATION = SETTINGS['CGRU_LOCATION']
-BLENDER_PATH = SETTINGS['BLENDER_PATH']
-ENVIRONMENT = SETTINGS['ENVIRONMENT']
-LOG_LEVEL = SETTINGS['LOG_LEVEL']
+KITSU_API_URL = SETTINGS.kitsu_api_url
+KITSU_USER = SETTINGS.kitsu_user
+KITSU_PASSWORD = SETTINGS.kitsu_password
+KITSU_DEFAULT_PROD = SETTINGS.kitsu_default_prod
+AFANASY_SERVER = SETTINGS.afanasy_server
+AFANASY_PORT = SETTINGS.afanasy_port
+CGRU_LOCATION = SETTINGS.cgru_location
+BLENDER_PATH = SETTINGS.blender_path
+ENVIRONMENT = SETTINGS.environment
+LOG_LEVEL = SETTINGS.log_level
 
 # Configure logging for modules that import config
 logging.basicConfig(level=getattr(logging, LOG_LEVEL.upper(), logging.INFO))
 logger = logging.getLogger('repo.config')
 
 
+# Set once init_cgru() has run; the environment doesn't change afterwards
+_cgru_initialized = False
+
+
 def init_cgru():
     """Initialize CGRU/Afanasy paths and cgruconfig.VARS if CGRU_LOCATION or AFANASY_SERVER present.
-    Safe to call multiple times.
+    Safe to call multiple times; only the first call does any work.
     """
+    global _cgru_initialized
+    if _cgru_initialized:
+        return
     # Add CGRU_LOCATION to sys.path if provided
     cg_location = CGRU_LOCATION
     if cg_location:
@@ -62,7 +87,7 @@ def init_cgru():
         # Also consider the CGRU_LOCATION itself
         candidates.insert(0, cg_location)
         for p in candidates:
-            if p and p not in sys.path and os.path.exists(p):
+            if p not in sys.path and os.path.exists(p):
                 sys.path.insert(0, p)
         os.environ['CGRU_LOCATION'] = cg_location
 
@@ -83,6 +108,9 @@ def init_cgru():
         # cgru not available on this environment; that's fine for offline edits
         logger.debug('cgruconfig not available; skipping CGRU init')
 
+    # A failed cgruconfig import won't succeed on a retry either
+    _cgru_initialized = True
+
 
 # Convenience function to ensure settings are loaded and CGRU is initialized
 def ensure():
@@ -4,77 +4,125 @@ A standalone PyQt6 desktop application for submitting Blender render jobs
 to the Afanasy render farm.
 """
 
+from __future__ import annotations
+
 import re
 import os
 import sys
 import json
+import logging
 import subprocess
 import shlex
+import stat
 import math
+import multiprocessing
+import threading
+import queue
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 from dataclasses import dataclass, field
+from functools import partial
 from typing import Optional
 
 import blend_parser
-
-# Initialize CGRU paths before importing af
 import config
-config.init_cgru()
 
-# Fallback: if CGRU_LOCATION in .env didn't resolve (e.g. Windows path on Linux),
-# auto-detect cgru_src relative to this script.
 _script_dir = os.path.dirname(os.path.abspath(__file__))
 _cgru_src = os.path.join(_script_dir, "cgru_src")
-if os.path.isdir(_cgru_src):
-    for _sub in ["lib/python", "afanasy/python", "lib", "python"]:
-        _p = os.path.join(_cgru_src, _sub)
-        if os.path.isdir(_p) and _p not in sys.path:
-            sys.path.insert(0, _p)
-    if "CGRU_LOCATION" not in os.environ or not os.path.isdir(os.environ.get("CGRU_LOCATION", "")):
-        os.environ["CGRU_LOCATION"] = _cgru_src
-
-# Ensure cgruconfig.VARS has required defaults for af.py
-import cgruconfig
-_CGRU_DEFAULTS = {
-    'af_priority': 99,
-    'af_task_default_service': 'generic',
-    'af_task_default_capacity': 1000,
-    'af_cmdprefix': '',
-}
-for _k, _v in _CGRU_DEFAULTS.items():
-    if _k not in cgruconfig.VARS:
-        cgruconfig.VARS[_k] = _v
-
-# Re-apply Afanasy server config (init_cgru may have run before cgruconfig was importable)
-if config.AFANASY_SERVER and cgruconfig.VARS.get('af_servername', '') != config.AFANASY_SERVER:
-    cgruconfig.VARS['af_servername'] = config.AFANASY_SERVER
-if config.AFANASY_PORT and cgruconfig.VARS.get('af_serverport', 0) != int(config.AFANASY_PORT):
-    cgruconfig.VARS['af_serverport'] = int(config.AFANASY_PORT)
+_INSPECTOR_SCRIPT = os.path.join(_script_dir, "blend_inspector.py")
+
+# Spawned parse workers (InspectorThread) re-run this module as __mp_main__;
+# they only call blend_parser, so they skip the CGRU setup and af import.
+_IS_PARSE_WORKER = __name__ == "__mp_main__"
+
+if not _IS_PARSE_WORKER:
+    # Initialize CGRU paths before importing af
+    config.init_cgru()
+
+    # Fallback: if CGRU_LOCATION in .env didn't resolve (e.g. Windows path on Linux),
+    # auto-detect cgru_src relative to this script.
+    if os.path.isdir(_cgru_src):
+        for _sub in ["lib/python", "afanasy/python", "lib", "python"]:
+            _p = os.path.join(_cgru_src, _sub)
+            if os.path.isdir(_p) and _p not in sys.path:
+                sys.path.insert(0, _p)
+        if "CGRU_LOCATION" not in os.environ or not os.path.isdir(os.environ.get("CGRU_LOCATION", "")):
+            os.environ["CGRU_LOCATION"] = _cgru_src
+
+    # Ensure cgruconfig.VARS has required defaults for af.py
+    import cgruconfig
+    _CGRU_DEFAULTS = {
+        'af_priority': 99,
+        'af_task_default_service': 'generic',
+        'af_task_default_capacity': 1000,
+        'af_cmdprefix': '',
+    }
+    for _k, _v in _CGRU_DEFAULTS.items():
+        if _k not in cgruconfig.VARS:
+            cgruconfig.VARS[_k] = _v
+
+    # Re-apply Afanasy server config (init_cgru may have run before cgruconfig was importable)
+    if config.AFANASY_SERVER and cgruconfig.VARS.get('af_servername', '') != config.AFANASY_SERVER:
+        cgruconfig.VARS['af_servername'] = config.AFANASY_SERVER
+    if config.AFANASY_PORT and cgruconfig.VARS.get('af_serverport', 0) != int(config.AFANASY_PORT):
+        cgruconfig.VARS['af_serverport'] = int(config.AFANASY_PORT)
 
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QSplitter, QTableWidget, QTableWidgetItem, QHeaderView,
+    QSplitter, QTableView, QHeaderView,
     QTabWidget, QLabel, QLineEdit, QPushButton, QSpinBox,
-    QCheckBox, QComboBox, QTextEdit, QProgressBar, QFileDialog,
-    QFormLayout, QListWidget, QListWidgetItem, QAbstractItemView,
+    QCheckBox, QComboBox, QTextEdit, QPlainTextEdit, QProgressBar, QFileDialog,
+    QFormLayout, QListWidget, QListWidgetItem, QListView, QAbstractItemView,
     QMessageBox, QDialog, QRadioButton, QButtonGroup, QGroupBox
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QSettings, QTimer
-from PyQt6.QtGui import QFont, QColor, QPalette, QShortcut, QKeySequence
+from PyQt6.QtCore import (
+    Qt, QThread, pyqtSignal, pyqtSlot, QSettings, QTimer, QStandardPaths, QFileSystemWatcher,
+    QAbstractTableModel, QAbstractListModel, QModelIndex, QSortFilterProxyModel,
+    QObject, QRunnable, QThreadPool
+)
+from PyQt6.QtGui import (
+    QFont, QColor, QPalette, QShortcut, QKeySequence, QSyntaxHighlighter, QTextCharFormat, QTextCursor
+)
+
+if not _IS_PARSE_WORKER:
+    import af
+
+logger = logging.getLogger('repo.desktop_app')
+
+# Shared foreground colours; parsed once instead of per table row
+_COLOR_OK = QColor("#66bb6a")
+_COLOR_ERROR = QColor("#ef5350")
+_COLOR_BUSY = QColor("#64b5f6")
+_COLOR_NEUTRAL = QColor("#777")
+_COLOR_DISABLED = QColor("#888")
+
+
+def job_name_for(filepath: str) -> str:
+    """Default job name for a .blend file: its basename without the extension."""
+    # Strip only the suffix, in any case: "shot.blend_v2.blend" keeps its
+    # middle and "Shot.BLEND" (matched by the scan) still loses its extension
+    name = os.path.basename(filepath)
+    return name[:-6] if name.lower().endswith(".blend") else name
 
-import af
 
 def remove_job_id_txt(filepath: str, job_id: str):
     """Remove the job_id txt file for a given blend file and job_id."""
     blend_dir = os.path.dirname(filepath)
     job_id_dir = os.path.join(blend_dir, "job_id")
-    job_name = os.path.basename(filepath).replace(".blend", "")
+    job_name = job_name_for(filepath)
     txt_filename = f"{job_name}_jobID_{job_id}.txt"
     txt_path = os.path.join(job_id_dir, txt_filename)
-    if os.path.exists(txt_path):
-        try:
-            os.remove(txt_path)
-        except Exception:
-            pass
+    # Just try the remove: a separate exists() check costs an extra stat
+    # and can still race with the file disappearing.
+    try:
+        os.remove(txt_path)
+    except OSError:
+        pass
+
+
+# {job_name}_jobID_{id}.txt, as written by SubmitThread
+_JOB_ID_SEP = "_jobID_"
 
 
 def scan_job_ids_for_directory(directory: str) -> list:
@@ -85,47 +133,178 @@ def scan_job_ids_for_directory(directory: str) -> list:
 
     File naming convention: {job_name}_jobID_{id}.txt
     """
-    import re as _re
     job_id_dir = os.path.join(directory, "job_id")
-    if not os.path.isdir(job_id_dir):
-        return []
+    # Open the directory directly instead of an isdir() probe first;
+    # a missing or non-directory job_id is the same OSError either way.
     results = []
-    pattern = _re.compile(r"^(.+)_jobID_(.+)\.txt$")
-    for fname in os.listdir(job_id_dir):
-        m = pattern.match(fname)
-        if m:
-            results.append((m.group(1), m.group(2)))
-    results.sort(key=lambda t: (0, int(t[1])) if t[1].isdigit() else (1, t[1]))
-    return results
+    try:
+        with os.scandir(job_id_dir) as it:
+            for entry in it:
+                name = entry.name
+                if not name.endswith(".txt"):
+                    continue
+                # Split on the last separator, so job names may contain it too
+                job_name, sep, job_id = name[:-4].rpartition(_JOB_ID_SEP)
+                if sep and job_name and job_id:
+                    results.append((job_name, job_id))
+    except OSError:
+        return []
+    # Name order first; sort_job_ids is stable, so entries sharing an id keep it
+    results.sort()
+    return sort_job_ids(results, key=lambda entry: entry[1])
+
+
+def job_ids_for_blend(blend_path: str) -> list:
+    """Return the job ID strings recorded in job_id/ for one blend file.
+
+    Only files named {job_name}_jobID_{id}.txt for this blend's job name
+    count. Returns an empty list if no job_id folder exists.
+    """
+    job_id_dir = os.path.join(os.path.dirname(blend_path), "job_id")
+    prefix = job_name_for(blend_path) + _JOB_ID_SEP
+    plen = len(prefix)
+    job_ids = []
+    try:
+        with os.scandir(job_id_dir) as it:
+            for entry in it:
+                name = entry.name
+                # Prefix and suffix are already checked, so the ID is a plain slice
+                if (len(name) > plen + 4 and name.startswith(prefix) and name.endswith(".txt")
+                        and entry.is_file(follow_symlinks=False)):
+                    job_ids.append(name[plen:-4])
+    except OSError:
+        return []
+    return job_ids
+
+
+def sort_job_ids(items: list, key=None) -> list:
+    """Numeric ids first in numeric order, then any others alphabetically.
+
+    key returns the id string of each item; by default the items are ids.
+    """
+    id_of = key or str  # str() of an id string is the string itself
+    numeric, other = [], []
+    for item in items:
+        (numeric if id_of(item).isdecimal() else other).append(item)
+    numeric.sort(key=lambda item: int(id_of(item)))
+    other.sort(key=id_of)
+    return numeric + other
+
+
+class JobIdCache(QObject):
+    """Sorted job_ids_for_blend() results, cached per job_id/ directory.
+
+    A QFileSystemWatcher drops a directory's entries whenever it reports a
+    change in it. Watchers can miss changes on network shares, so explicit
+    Reload buttons call invalidate() before asking again.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # job_id dir -> {blend path: sorted job ids}
+        self._cache = {}
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.directoryChanged.connect(self._on_dir_changed)
+
+    def job_ids(self, blend_path: str) -> list:
+        job_id_dir = os.path.join(os.path.dirname(blend_path), "job_id")
+        dir_cache = self._cache.get(job_id_dir)
+        if dir_cache is not None and blend_path in dir_cache:
+            return dir_cache[blend_path]
+        job_ids = sort_job_ids(job_ids_for_blend(blend_path))
+        # Only cache what the watcher can invalidate; a job_id dir that does
+        # not exist yet is cheap to probe and may appear after a submission.
+        if dir_cache is None:
+            watched = job_id_dir in self._watcher.directories()
+            if not watched and not (os.path.isdir(job_id_dir) and self._watcher.addPath(job_id_dir)):
+                return job_ids
+            dir_cache = self._cache[job_id_dir] = {}
+        dir_cache[blend_path] = job_ids
+        return job_ids
+
+    def invalidate(self, blend_path: str):
+        """Forget the listing of blend_path's job_id dir, so it is rescanned."""
+        self._cache.pop(os.path.join(os.path.dirname(blend_path), "job_id"), None)
+
+    def _on_dir_changed(self, path: str):
+        self._cache.pop(path, None)
 
 
 # ---------------------------------------------------------------------------
 # Utility functions
 # ---------------------------------------------------------------------------
 
+def _quote_arg_windows(arg: str) -> str:
+    # Windows command line: escape internal double quotes by doubling them
+    # Wrap in double quotes
+    escaped = arg.replace('"', '""')
+    return f'"{escaped}"'
+
+
+# Chosen once at import; os.name never changes for the life of the process
+_quote_arg_platform = _quote_arg_windows if os.name == 'nt' else shlex.quote
+
+# Arguments made only of these characters need no quoting on either shell
+_SAFE_ARG_RE = re.compile(r"[A-Za-z0-9_./-]+")
+
+
 def quote_arg(arg: str) -> str:
     """Quote a shell argument in an OS-aware manner.
-    
+
     On POSIX systems (Linux, macOS): uses shlex.quote() with single quotes.
     On Windows (nt): uses double quotes with proper escaping.
-    
+
     This ensures commands work correctly on both Unix render nodes and Windows render nodes.
     """
-    if os.name == 'nt':
-        # Windows command line: escape internal double quotes by doubling them
-        # Wrap in double quotes
-        escaped = arg.replace('"', '""')
-        return f'"{escaped}"'
-    else:
-        # POSIX systems: use shlex.quote() for proper shell escaping
-        return shlex.quote(arg)
+    if _SAFE_ARG_RE.fullmatch(arg):
+        return arg
+    return _quote_arg_platform(arg)
+
+
+def _fold_case(text: str) -> str:
+    """Case-fold text for case-insensitive filtering.
+
+    ASCII text takes str.lower(), which CPython already runs as a plain
+    ASCII loop; other text gets casefold() so e.g. "ß" matches "ss".
+    """
+    if text.isascii():
+        # Typed needles are usually lowercase already: skip the copy
+        return text if not text or text.islower() else text.lower()
+    return text.casefold()
+
+
+def _iter_blend_files(root: str):
+    """Yield .blend file paths under root, in the same order os.walk would.
+
+    Uses os.scandir so the file/directory check comes from the directory
+    read itself instead of an extra stat per entry. Unreadable directories
+    are skipped silently, matching os.walk's default behaviour.
+    """
+    try:
+        with os.scandir(root) as it:
+            entries = list(it)
+    except OSError:
+        return
+    files = []
+    subdirs = []
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            subdirs.append(entry.path)
+        elif entry.name.lower().endswith(".blend"):
+            # Lowercase once so "Shot.BLEND" from Windows shares is picked up;
+            # .blend1/.blend2 backups never match the suffix.
+            files.append(entry.path)
+    files.sort()
+    yield from files
+    for subdir in subdirs:
+        yield from _iter_blend_files(subdir)
 
 
 # ---------------------------------------------------------------------------
 # Data model
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class BlendFileData:
     """Holds per-file metadata (detected + overrides)."""
     filepath: str = ""
@@ -158,71 +337,305 @@ class BlendFileData:
 # Inspector Thread
 # ---------------------------------------------------------------------------
 
+class InspectionCache:
+    """On-disk cache of inspection metadata keyed by (abspath, mtime_ns, size).
+
+    Re-inspecting an unchanged library then costs one stat per file instead
+    of a parse. Loaded lazily on first use (from the inspector thread, not
+    the UI thread) and written back atomically via os.replace. Error results
+    are never cached.
+    """
+    VERSION = 1  # bump when the metadata format changes
+
+    def __init__(self, path: str):
+        self.path = path
+        self._entries = None
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def _load(self):
+        if self._entries is not None:
+            return
+        self._entries = {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == self.VERSION:
+                self._entries = data.get("entries", {})
+        except (OSError, ValueError, AttributeError):
+            pass
+
+    def get(self, filepath: str, st: os.stat_result) -> Optional[dict]:
+        with self._lock:
+            self._load()
+            entry = self._entries.get(os.path.abspath(filepath))
+        if entry and entry["mtime"] == st.st_mtime_ns and entry["size"] == st.st_size:
+            return entry["meta"]
+        return None
+
+    def put(self, filepath: str, st: os.stat_result, metadata: dict):
+        with self._lock:
+            self._load()
+            self._entries[os.path.abspath(filepath)] = {
+                "mtime": st.st_mtime_ns, "size": st.st_size, "meta": metadata,
+            }
+            self._dirty = True
+
+    def save(self):
+        with self._lock:
+            if not self._dirty:
+                return
+            tmp_path = self.path + ".tmp"
+            try:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump({"version": self.VERSION, "entries": self._entries}, f)
+                os.replace(tmp_path, self.path)
+                self._dirty = False
+            except OSError as e:
+                logger.warning("Failed to write inspection cache %s: %s", self.path, e)
+
+
+# Upper bound on threads parsing .blend files at once during inspection.
+INSPECT_MAX_WORKERS = min(8, os.cpu_count() or 4)
+
+
 class InspectorThread(QThread):
     """Runs Blender headless to inspect .blend files for metadata."""
     file_inspected = pyqtSignal(str, dict)  # filepath, metadata_dict or {"error": msg}
     all_done = pyqtSignal()
 
-    def __init__(self, files: list, blender_path: str, inspector_script: str):
+    def __init__(self, files: list, blender_path: str, inspector_script: str,
+                 cache: Optional[InspectionCache] = None):
         super().__init__()
         self.files = files
         self.blender_path = blender_path
         self.inspector_script = inspector_script
+        self.cache = cache
+        self._stats = {}  # filepath → os.stat_result, for cache keys
         self._stop = False
 
     def stop(self):
         self._stop = True
 
     def run(self):
-        blender_missing = False
-        for filepath in self.files:
-            if self._stop:
-                break
-            
-            # Try fast binary parsing first (no Blender subprocess needed)
-            if blend_parser.is_available():
+        pending = self._emit_cached(self.files) if self.cache else self.files
+        # Try fast binary parsing first (no Blender subprocess needed)
+        if pending and blend_parser.is_available():
+            pending = self._inspect_binary(pending)
+        # Fallback: Blender headless inspection for whatever the parser couldn't read
+        if pending and not self._stop:
+            self._inspect_with_blender(pending)
+        if self.cache:
+            self.cache.save()
+        self.all_done.emit()
+
+    def _emit_cached(self, files: list) -> list:
+        """Emit cached metadata for unchanged files; return the rest."""
+        pending = []
+        for filepath in files:
+            try:
+                st = os.stat(filepath)
+            except OSError:
+                pending.append(filepath)  # let the real inspection report it
+                continue
+            self._stats[filepath] = st
+            metadata = self.cache.get(filepath, st)
+            if metadata is not None:
+                self.file_inspected.emit(filepath, metadata)
+            else:
+                pending.append(filepath)
+        return pending
+
+    def _emit_result(self, filepath: str, metadata: dict):
+        st = self._stats.get(filepath)
+        if self.cache and st is not None:
+            self.cache.put(filepath, st, metadata)
+        self.file_inspected.emit(filepath, metadata)
+
+    def _inspect_binary(self, files: list) -> list:
+        """Parse files with blend_parser, emitting results as they complete.
+
+        Plain files are dominated by reads, which release the GIL, so they
+        go to a thread pool. Compressed files spend their time decompressing
+        and decoding in Python, so when there are several of them they get a
+        process pool instead and run on separate cores.
+        Returns the files that failed to parse, in their original order.
+        """
+        if not files:
+            return []
+        compressed = [fp for fp in files if blend_parser.is_compressed(fp)]
+        if len(compressed) < 2:
+            compressed = []  # a pool of processes isn't worth it for one file
+        compressed_set = set(compressed)
+        plain = [fp for fp in files if fp not in compressed_set]
+
+        failed = set()
+        pools = []
+        futures = {}
+        try:
+            if plain:
+                threads = ThreadPoolExecutor(max_workers=max(1, min(INSPECT_MAX_WORKERS, len(plain))))
+                pools.append(threads)
+                futures.update({threads.submit(blend_parser.parse_blend, fp): fp for fp in plain})
+            if compressed:
+                # spawn, not fork: forking a process that runs Qt threads isn't safe
+                procs = ProcessPoolExecutor(
+                    max_workers=min(os.cpu_count() or 1, len(compressed)),
+                    mp_context=multiprocessing.get_context("spawn"))
+                pools.append(procs)
+                futures.update({procs.submit(blend_parser.parse_blend, fp): fp for fp in compressed})
+            for future in as_completed(futures):
+                if self._stop:
+                    break
+                filepath = futures[future]
                 try:
-                    metadata = blend_parser.parse_blend(filepath)
-                    self.file_inspected.emit(filepath, metadata)
+                    metadata = future.result()
+                except Exception as e:
+                    logger.info("Binary parse failed for %s: %s. Trying Blender headless...", filepath, e)
+                    failed.add(filepath)
+                    continue
+                self._emit_result(filepath, metadata)
+        finally:
+            for pool in pools:
+                pool.shutdown(wait=True, cancel_futures=True)
+        return [fp for fp in files if fp in failed]
+
+    def _inspect_with_blender(self, files: list):
+        blender_missing = False
+        worker = None  # started on the first file that needs Blender
+        try:
+            for filepath in files:
+                if self._stop:
+                    break
+                if blender_missing:
+                    self.file_inspected.emit(filepath, {"error": f"Blender not found: {self.blender_path}"})
                     continue
+                try:
+                    if worker is None:
+                        worker = BlenderInspectorWorker(self.blender_path, self.inspector_script)
+                    metadata = worker.inspect(filepath, 120, lambda: self._stop)
+                    self._emit_result(filepath, metadata)
+                except InterruptedError:
+                    break
+                except subprocess.TimeoutExpired:
+                    self.file_inspected.emit(filepath, {"error": "Timeout (120s)"})
+                    worker.kill()
+                    worker = None
+                except FileNotFoundError:
+                    blender_missing = True
+                    self.file_inspected.emit(filepath, {"error": f"Blender not found: {self.blender_path}"})
                 except Exception as e:
-                    # Binary parsing failed, fall back to Blender headless
-                    print(f"Binary parse failed for {filepath}: {e}. Trying Blender headless...")
-            
-            # Fallback: Blender headless inspection
-            if blender_missing:
-                self.file_inspected.emit(filepath, {"error": f"Blender not found: {self.blender_path}"})
-                continue
-            try:
-                result = subprocess.run(
-                    [self.blender_path, "-b", filepath, "-P", self.inspector_script],
-                    capture_output=True, text=True, timeout=120
-                )
-                metadata = None
-                for line in result.stdout.splitlines():
-                    if line.startswith("BLEND_INSPECTOR_JSON:"):
-                        json_str = line[len("BLEND_INSPECTOR_JSON:"):]
-                        metadata = json.loads(json_str)
-                        break
-                if metadata:
-                    self.file_inspected.emit(filepath, metadata)
+                    self.file_inspected.emit(filepath, {"error": str(e)})
+                    if worker is not None and not worker.is_alive():
+                        worker = None  # crashed on this file; restart for the next one
+        finally:
+            if worker is not None:
+                if self._stop:
+                    worker.kill()
                 else:
-                    stderr_short = (result.stderr or "")[:200]
-                    self.file_inspected.emit(filepath, {"error": f"No metadata found. {stderr_short}"})
-            except subprocess.TimeoutExpired:
-                self.file_inspected.emit(filepath, {"error": "Timeout (120s)"})
-            except FileNotFoundError:
-                blender_missing = True
-                self.file_inspected.emit(filepath, {"error": f"Blender not found: {self.blender_path}"})
-            except Exception as e:
-                self.file_inspected.emit(filepath, {"error": str(e)})
-        self.all_done.emit()
+                    worker.close()
+
+
+class BlenderInspectorWorker:
+    """One Blender process running blend_inspector.py in --serve mode.
+
+    Blender startup dominates the cost of a headless inspection, so the
+    process is kept alive for the whole batch and fed one .blend path per
+    line on stdin. stdout is pumped by a reader thread into a queue so each
+    request can be waited on with a timeout on every platform; only the
+    last few stderr lines are kept for error messages.
+
+    The pipes are read as bytes: Blender's own log output is matched against
+    the marker prefixes and dropped without ever being decoded, and only the
+    reply lines are turned into str.
+    """
+    JSON_PREFIX = "BLEND_INSPECTOR_JSON:"
+    ERROR_PREFIX = "BLEND_INSPECTOR_ERROR:"
+    _REPLY_MARKERS = (JSON_PREFIX.encode(), ERROR_PREFIX.encode())
+
+    def __init__(self, blender_path: str, inspector_script: str):
+        self.proc = subprocess.Popen(
+            [blender_path, "-b", "-P", inspector_script, "--", "--serve"],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        )
+        self._replies = queue.Queue()
+        self._eof = False
+        self._stderr_tail = deque(maxlen=20)
+        threading.Thread(target=self._pump_stdout, daemon=True).start()
+        threading.Thread(
+            target=lambda: self._stderr_tail.extend(self.proc.stderr), daemon=True).start()
+
+    def _pump_stdout(self):
+        for line in self.proc.stdout:
+            if line.startswith(self._REPLY_MARKERS):
+                self._replies.put(line.decode("utf-8", errors="replace").rstrip("\r\n"))
+        self._eof = True
+        self._replies.put(None)  # EOF: Blender exited
+
+    def is_alive(self) -> bool:
+        return not self._eof and self.proc.poll() is None
+
+    def inspect(self, filepath: str, timeout: float, should_stop) -> dict:
+        """Inspect one file and return its metadata dict.
+
+        Raises subprocess.TimeoutExpired after `timeout` seconds,
+        InterruptedError if should_stop() turns true while waiting, and
+        RuntimeError if Blender reports an error or exits.
+        """
+        try:
+            self.proc.stdin.write(filepath.encode("utf-8") + b"\n")
+            self.proc.stdin.flush()
+        except OSError:
+            raise RuntimeError(f"No metadata found. {self._stderr_short()}") from None
+        deadline = time.monotonic() + timeout
+        while True:
+            if should_stop():
+                raise InterruptedError
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise subprocess.TimeoutExpired(self.proc.args, timeout)
+            try:
+                line = self._replies.get(timeout=min(remaining, 0.25))
+            except queue.Empty:
+                continue
+            if line is None:
+                # Put the marker back so later calls see the EOF too
+                self._replies.put(None)
+                raise RuntimeError(f"No metadata found. {self._stderr_short()}")
+            if line.startswith(self.JSON_PREFIX):
+                return json.loads(line[len(self.JSON_PREFIX):])
+            raise RuntimeError(line[len(self.ERROR_PREFIX):])
+
+    def _stderr_short(self) -> str:
+        return b"".join(self._stderr_tail).decode("utf-8", errors="replace")[-200:]
+
+    def close(self):
+        """Let Blender exit on its own by closing stdin; kill it if it hangs."""
+        try:
+            self.proc.stdin.close()
+        except OSError:
+            pass
+        try:
+            self.proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            self.kill()
+
+    def kill(self):
+        self.proc.kill()
+        self.proc.wait()
 
 
 # ---------------------------------------------------------------------------
 # Submit Thread
 # ---------------------------------------------------------------------------
 
+# Upper bound on concurrent Afanasy submissions from one batch.
+SUBMIT_MAX_WORKERS = min(8, os.cpu_count() or 1)
+# Writers for job_id txt files; these only wait on (often networked) storage.
+JOB_ID_IO_WORKERS = 4
+
+
 class SubmitThread(QThread):
     """Submits jobs to Afanasy in background."""
     job_submitted = pyqtSignal(str, bool, str)  # filepath, success, message
@@ -232,42 +645,117 @@ class SubmitThread(QThread):
         """jobs: list of (filepath, BlendFileData, settings_dict)"""
         super().__init__()
         self.jobs = jobs
+        # job_id directories already created during this batch; many files
+        # usually share one directory, so makedirs only runs once per dir.
+        self._job_id_dirs = set()
 
     def run(self):
+        # Job objects are built up front (CPU only, no network) so the pool
+        # below does nothing but send; a bad file is reported right away.
+        pending = []
         for filepath, file_data, settings in self.jobs:
             try:
-                result = submit_blend_job(filepath, file_data, settings)
-                if result and result[0]:
-                    job_id = ""
-                    if isinstance(result[1], dict) and "id" in result[1]:
-                        job_id = result[1]["id"]
-                        # Write job_id txt file (in separate try-except to avoid failing the entire submission)
-                        try:
-                            blend_dir = os.path.dirname(filepath)
-                            job_id_dir = os.path.join(blend_dir, "job_id")
-                            os.makedirs(job_id_dir, exist_ok=True)
-                            job_name = os.path.basename(filepath).replace(".blend", "")
-                            txt_filename = f"{job_name}_jobID_{job_id}.txt"
-                            txt_path = os.path.join(job_id_dir, txt_filename)
-                            with open(txt_path, "w") as f:
-                                f.write(f"Job Name: {job_name}\nJob ID: {job_id}\nBlend File: {filepath}\n")
-                        except Exception as io_err:
-                            # File I/O error should not fail the job submission
-                            # Log it but still report the job as successfully submitted
-                            import logging
-                            logging.warning(f"Failed to write job_id txt file for {filepath}: {io_err}")
-                    self.job_submitted.emit(filepath, True, f"Submitted (ID: {job_id})")
-                else:
-                    self.job_submitted.emit(filepath, False, "Server rejected job")
+                pending.append((filepath, build_blend_job(filepath, file_data, settings)))
             except Exception as e:
                 self.job_submitted.emit(filepath, False, str(e))
+
+        # Each send is mostly network wait on the Afanasy server, so a small
+        # pool overlaps them without flooding the server.
+        workers = max(1, min(SUBMIT_MAX_WORKERS, len(pending)))
+        # job_id txt files go to their own pool so slow shared storage never
+        # delays the next submission; leaving the with-block drains it before
+        # all_done is emitted.
+        with ThreadPoolExecutor(max_workers=JOB_ID_IO_WORKERS) as io_pool, \
+                ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                pool.submit(self._send_one, filepath, job, io_pool): filepath
+                for filepath, job in pending
+            }
+            for future in as_completed(futures):
+                filepath = futures[future]
+                try:
+                    success, message = future.result()
+                except Exception as e:
+                    success, message = False, str(e)
+                self.job_submitted.emit(filepath, success, message)
         self.all_done.emit()
 
+    def _send_one(self, filepath: str, job: af.Job, io_pool: ThreadPoolExecutor):
+        """Send one built job and queue its job_id txt file. Returns (success, message)."""
+        result = job.send(verbose=False)
+        if not (result and result[0]):
+            return False, "Server rejected job"
+        job_id = ""
+        if isinstance(result[1], dict) and "id" in result[1]:
+            job_id = result[1]["id"]
+            io_pool.submit(self._write_job_id_file, filepath, job_id)
+        return True, f"Submitted (ID: {job_id})"
+
+    def _write_job_id_file(self, filepath: str, job_id):
+        """Write the job_id txt file next to the blend file."""
+        try:
+            job_id_dir = os.path.join(os.path.dirname(filepath), "job_id")
+            if job_id_dir not in self._job_id_dirs:
+                os.makedirs(job_id_dir, exist_ok=True)
+                self._job_id_dirs.add(job_id_dir)
+            job_name = job_name_for(filepath)
+            txt_path = os.path.join(job_id_dir, f"{job_name}_jobID_{job_id}.txt")
+            with open(txt_path, "w") as f:
+                f.write(f"Job Name: {job_name}\nJob ID: {job_id}\nBlend File: {filepath}\n")
+        except Exception as io_err:
+            # File I/O error should not fail the job submission
+            # Log it but still report the job as successfully submitted
+            logger.warning("Failed to write job_id txt file for %s: %s", filepath, io_err)
+
 
 # ---------------------------------------------------------------------------
 # Job Fetch Thread
 # ---------------------------------------------------------------------------
 
+_AfanasyService = None
+
+
+def _afanasy_service():
+    """Return the AfanasyService class, importing it on first use.
+
+    The import stays lazy so a missing or broken service module surfaces as
+    a fetch error in the dialogs instead of stopping the app from starting.
+    A failed import is not cached and is retried on the next fetch.
+    """
+    global _AfanasyService
+    if _AfanasyService is None:
+        from afanasy_service_complete import AfanasyService
+        _AfanasyService = AfanasyService
+    return _AfanasyService
+
+
+def _fetch_job_data(emitter, job_id: int, mode: str,
+                    block_num: int = None, task_num: int = None):
+    """Fetch job info or task output and report it through emitter's
+    job_loaded / output_loaded / error signals."""
+    try:
+        AfanasyService = _afanasy_service()
+        if mode == "job_info":
+            result = AfanasyService.get_job_by_id(job_id)
+            if result:
+                emitter.job_loaded.emit(result)
+            else:
+                emitter.error.emit(
+                    f"Job ID {job_id} not found on farm.\n"
+                    "The job may have been deleted. Try another ID."
+                )
+        elif mode == "task_output":
+            result = AfanasyService.get_task_output(job_id, block_num, task_num)
+            if result and "error" not in result:
+                emitter.output_loaded.emit(result.get("output", ""))
+            elif result and "error" in result:
+                emitter.error.emit(result["error"])
+            else:
+                emitter.error.emit("Could not fetch task output.")
+    except Exception as e:
+        emitter.error.emit(str(e))
+
+
 class JobFetchThread(QThread):
     """Fetches job info or task output from Afanasy in the background."""
     job_loaded    = pyqtSignal(dict)   # full job info dict
@@ -286,64 +774,141 @@ class JobFetchThread(QThread):
         self.block_num = block_num
         self.task_num = task_num
 
+    def run(self):
+        _fetch_job_data(self, self.job_id, self.mode, self.block_num, self.task_num)
+
+
+class JobFetchSignals(QObject):
+    """Signals for JobFetchTask (QRunnable cannot declare its own)."""
+    job_loaded    = pyqtSignal(dict)
+    output_loaded = pyqtSignal(str)
+    error         = pyqtSignal(str)
+    done          = pyqtSignal()
+
+
+class JobFetchTask(QRunnable):
+    """JobFetchThread's work as a pooled task, for periodic re-fetches that
+    should not create a new thread each time."""
+
+    def __init__(self, signals: JobFetchSignals, job_id: int, mode: str,
+                 block_num: int = None, task_num: int = None):
+        super().__init__()
+        self.signals = signals
+        self.job_id = job_id
+        self.mode = mode
+        self.block_num = block_num
+        self.task_num = task_num
+
     def run(self):
         try:
-            from afanasy_service_complete import AfanasyService
-            if self.mode == "job_info":
-                result = AfanasyService.get_job_by_id(self.job_id)
-                if result:
-                    self.job_loaded.emit(result)
-                else:
-                    self.error.emit(
-                        f"Job ID {self.job_id} not found on farm.\n"
-                        "The job may have been deleted. Try another ID."
-                    )
-            elif self.mode == "task_output":
-                result = AfanasyService.get_task_output(
-                    self.job_id, self.block_num, self.task_num
-                )
-                if result and "error" not in result:
-                    self.output_loaded.emit(result.get("output", ""))
-                elif result and "error" in result:
-                    self.error.emit(result["error"])
-                else:
-                    self.error.emit("Could not fetch task output.")
-        except Exception as e:
-            self.error.emit(str(e))
+            _fetch_job_data(self.signals, self.job_id, self.mode,
+                            self.block_num, self.task_num)
+        finally:
+            self.signals.done.emit()
+
+
+class OutputFilterThread(QThread):
+    """Runs one of JobLogDialog's output filters off the GUI thread.
+
+    filter_func must be one of the dialog's class-level filters: it splits
+    the text itself and touches no dialog state. The result carries the
+    request's generation number so the dialog can drop results that a newer
+    request has superseded.
+    """
+    filtered = pyqtSignal(int, str)   # (generation, filtered text)
+
+    def __init__(self, filter_func, text: str, generation: int):
+        super().__init__()
+        self.filter_func = filter_func
+        self.text = text
+        self.generation = generation
+
+    def run(self):
+        self.filtered.emit(self.generation, self.filter_func(self.text))
 
 
 # ---------------------------------------------------------------------------
-# Job Stats Fetch Thread
+# Job Stats Fetch Task
 # ---------------------------------------------------------------------------
 
-class JobStatsFetchThread(QThread):
-    """Fetches get_job_stats() data for a single job in the background."""
-    stats_loaded = pyqtSignal(dict)   # full stats dict from get_job_stats()
-    error        = pyqtSignal(str)    # error message string
+class JobStatsFetchSignals(QObject):
+    """Signals for JobStatsFetchTask (QRunnable cannot declare its own)."""
+    stats_loaded = pyqtSignal(dict)      # full stats dict from get_job_stats()
+    error        = pyqtSignal(int, str)  # job ID, error message string
+    job_done     = pyqtSignal(int)       # job ID, after its reply or error
+    done         = pyqtSignal()
+
+
+class JobStatsFetchTask(QRunnable):
+    """Fetches get_job_stats() data for one or more jobs on a thread pool.
 
-    def __init__(self, job_id: int):
+    Several jobs are fetched one after another on the same worker, with
+    stats_loaded / error and then job_done emitted per job as each reply
+    arrives.
+    """
+
+    def __init__(self, signals: JobStatsFetchSignals, job_ids: list):
         super().__init__()
-        self.job_id = job_id
+        self.signals = signals
+        self.job_ids = job_ids
 
     def run(self):
         try:
-            from afanasy_service_complete import AfanasyService
-            result = AfanasyService.get_job_stats(self.job_id)
-            if result:
-                self.stats_loaded.emit(result)
-            else:
-                self.error.emit(
-                    f"Job ID {self.job_id} not found on farm.\n"
-                    "The job may have been deleted."
-                )
+            AfanasyService = _afanasy_service()
+            for job_id in self.job_ids:
+                try:
+                    result = AfanasyService.get_job_stats(job_id)
+                    if result:
+                        self.signals.stats_loaded.emit(result)
+                    else:
+                        self.signals.error.emit(
+                            job_id,
+                            f"Job ID {job_id} not found on farm.\n"
+                            "The job may have been deleted."
+                        )
+                except Exception as e:
+                    self.signals.error.emit(job_id, str(e))
+                finally:
+                    self.signals.job_done.emit(job_id)
         except Exception as e:
-            self.error.emit(str(e))
+            for job_id in self.job_ids:
+                self.signals.error.emit(job_id, str(e))
+                self.signals.job_done.emit(job_id)
+        finally:
+            self.signals.done.emit()
 
 
 # ---------------------------------------------------------------------------
 # Submission engine
 # ---------------------------------------------------------------------------
 
+def _build_blender_cmd(
+    blender: str,
+    blend_file: str,
+    scene_name: str,
+    output_path: str,
+    output_format: str,
+    frame_step: int
+) -> str:
+    """Build the Blender render command line for one block.
+
+    Relies on blend file's view layer states (vl.use flags): Blender renders
+    all layers with vl.use=True automatically, so no Python expression is
+    passed. Arguments are collected in a list and joined once; only
+    user-supplied values are quoted, Afanasy's @#@ frame tokens stay bare.
+    """
+    argv = [quote_arg(blender), "-b", quote_arg(blend_file), "-y"]
+    if scene_name:
+        argv += ["-S", quote_arg(scene_name)]
+    if output_path:
+        argv += ["-o", quote_arg(output_path)]
+    if output_format:
+        argv += ["-F", quote_arg(output_format)]
+    # Use animation rendering for proper frame iteration with Afanasy
+    argv += ["-s", "@#@", "-e", "@#@", "-j", str(frame_step), "-a"]
+    return " ".join(argv)
+
+
 def _create_block_for_layer(
     blend_file: str,
     scene_name: str,
@@ -354,27 +919,15 @@ def _create_block_for_layer(
     frame_step: int,
     output_path: str,
     output_format: str,
-    blender: str
+    blender: str,
+    working_dir: str
 ) -> af.Block:
     """Create a single block for one view layer (multi-block mode).
 
     Relies on blend file's view layer states (vl.use flags).
     Blender automatically renders all enabled layers.
     """
-    cmd = f'{quote_arg(blender)} -b {quote_arg(blend_file)} -y'
-    if scene_name:
-        cmd += f' -S {quote_arg(scene_name)}'
-
-    # Python expression removed - rely on blend file layer states
-    # Blender renders all layers with vl.use=True automatically
-
-    if output_path:
-        cmd += f' -o {quote_arg(output_path)}'
-    if output_format:
-        cmd += f' -F {quote_arg(output_format)}'
-
-    # Use animation rendering for proper frame iteration with Afanasy
-    cmd += f' -s @#@ -e @#@ -j {frame_step} -a'
+    cmd = _build_blender_cmd(blender, blend_file, scene_name, output_path, output_format, frame_step)
 
     block_name = scene_name or "render"
     if layer_name:
@@ -383,7 +936,7 @@ def _create_block_for_layer(
     block = af.Block(block_name, 'blender')
     block.setCommand(cmd, prefix=False)
     block.setNumeric(frame_start, frame_end, frames_per_task, frame_step)
-    block.setWorkingDirectory(os.path.dirname(blend_file))
+    block.setWorkingDirectory(working_dir)
 
     return block
 
@@ -398,28 +951,15 @@ def _create_single_block_for_layers(
     frame_step: int,
     output_path: str,
     output_format: str,
-    blender: str
+    blender: str,
+    working_dir: str
 ) -> af.Block:
     """Create a single block for all selected layers (single-block mode).
 
     Relies on blend file's view layer states (vl.use flags).
     Blender automatically renders all enabled layers and outputs each to its own path.
     """
-    cmd = f'{quote_arg(blender)} -b {quote_arg(blend_file)} -y'
-    if scene_name:
-        cmd += f' -S {quote_arg(scene_name)}'
-
-    # Python expression removed - rely on blend file layer states
-    # Blender renders all layers with vl.use=True automatically
-    # User controls layer states by editing the blend file before submission
-
-    if output_path:
-        cmd += f' -o {quote_arg(output_path)}'
-    if output_format:
-        cmd += f' -F {quote_arg(output_format)}'
-
-    # Use animation rendering for proper frame iteration with Afanasy
-    cmd += f' -s @#@ -e @#@ -j {frame_step} -a'
+    cmd = _build_blender_cmd(blender, blend_file, scene_name, output_path, output_format, frame_step)
 
     # Block naming
     if len(layer_names) == 1:
@@ -431,23 +971,19 @@ def _create_single_block_for_layers(
     block.setCommand(cmd, prefix=False)
     # Use normal frames_per_task (workaround no longer needed with animation rendering)
     block.setNumeric(frame_start, frame_end, frames_per_task, frame_step)
-    block.setWorkingDirectory(os.path.dirname(blend_file))
+    block.setWorkingDirectory(working_dir)
 
     return block
 
 
-def _submit_single_scene_mode(job: af.Job, blend_file: str, file_data: BlendFileData, blender: str, parallel_mode: bool):
+def _submit_single_scene_mode(job: af.Job, blend_file: str, file_data: BlendFileData, blender: str, parallel_mode: bool,
+                              working_dir: str):
     """Submit a single scene with selected layers."""
     scene_name = file_data.selected_scene
     layers = file_data.selected_layers if file_data.selected_layers else [""]
 
     # Filter out non-string entries if any (shouldn't happen but be safe)
-    layer_names = []
-    for layer_item in layers:
-        if isinstance(layer_item, str):
-            name = layer_item.strip()
-            if name:
-                layer_names.append(name)
+    layer_names = [name for name in (item.strip() for item in layers if isinstance(item, str)) if name]
 
     if not layer_names:
         layer_names = [""]  # Render active layer
@@ -459,7 +995,7 @@ def _submit_single_scene_mode(job: af.Job, blend_file: str, file_data: BlendFile
                 blend_file, scene_name, layer_name,
                 file_data.frame_start, file_data.frame_end,
                 file_data.frames_per_task, file_data.frame_step,
-                file_data.output_path, file_data.output_format, blender
+                file_data.output_path, file_data.output_format, blender, working_dir
             )
             job.blocks.append(block)
     else:
@@ -468,25 +1004,24 @@ def _submit_single_scene_mode(job: af.Job, blend_file: str, file_data: BlendFile
             blend_file, scene_name, layer_names,
             file_data.frame_start, file_data.frame_end,
             file_data.frames_per_task, file_data.frame_step,
-            file_data.output_path, file_data.output_format, blender
+            file_data.output_path, file_data.output_format, blender, working_dir
         )
         job.blocks.append(block)
 
 
-def _submit_all_scenes_mode(job: af.Job, blend_file: str, file_data: BlendFileData, blender: str, parallel_mode: bool):
+def _submit_all_scenes_mode(job: af.Job, blend_file: str, file_data: BlendFileData, blender: str, parallel_mode: bool,
+                            working_dir: str):
     """Submit all scenes with their individual settings."""
+    blocks = []
     for scene in file_data.scenes:
         scene_name = scene.get("name", "")
         scene_layers = scene.get("view_layers", [])
 
-        # Extract enabled layer names
-        layer_names = []
-        for layer_data in scene_layers:
-            layer_name = layer_data.get("name", "").strip()
-            layer_enabled = layer_data.get("use", True)
-            # Skip disabled layers to prevent black frame renders
-            if layer_enabled and layer_name:
-                layer_names.append(layer_name)
+        # Extract enabled layer names, skipping disabled layers to prevent black frame renders
+        layer_names = [
+            name for name in (layer.get("name", "").strip() for layer in scene_layers if layer.get("use", True))
+            if name
+        ]
 
         if not layer_names:
             layer_names = [""]  # Render active layer
@@ -505,22 +1040,24 @@ def _submit_all_scenes_mode(job: af.Job, blend_file: str, file_data: BlendFileDa
                     blend_file, scene_name, layer_name,
                     scene_start, scene_end,
                     file_data.frames_per_task, scene_step,
-                    scene_output, scene_format, blender
+                    scene_output, scene_format, blender, working_dir
                 )
-                job.blocks.append(block)
+                blocks.append(block)
         else:
             # Single-block: One block per scene (all layers together)
             block = _create_single_block_for_layers(
                 blend_file, scene_name, layer_names,
                 scene_start, scene_end,
                 file_data.frames_per_task, scene_step,
-                scene_output, scene_format, blender
+                scene_output, scene_format, blender, working_dir
             )
-            job.blocks.append(block)
+            blocks.append(block)
 
+    job.blocks.extend(blocks)
 
-def submit_blend_job(blend_file: str, file_data: BlendFileData, settings: dict):
-    """Submit a single .blend file as an Afanasy job.
+
+def build_blend_job(blend_file: str, file_data: BlendFileData, settings: dict) -> af.Job:
+    """Build the Afanasy job for a single .blend file without sending it.
 
     Supports two submission modes:
     - Multi-block (parallel): Each view layer renders as a separate block
@@ -548,22 +1085,29 @@ def submit_blend_job(blend_file: str, file_data: BlendFileData, settings: dict):
     blender = settings.get("blender_path", "blender")
     render_all_scenes = (file_data.selected_scene == "⚡ All Scenes")
     parallel_mode = file_data.render_layers_parallel
+    # Same for every block of the job
+    working_dir = os.path.dirname(blend_file)
 
     if render_all_scenes:
-        _submit_all_scenes_mode(job, blend_file, file_data, blender, parallel_mode)
+        _submit_all_scenes_mode(job, blend_file, file_data, blender, parallel_mode, working_dir)
     else:
-        _submit_single_scene_mode(job, blend_file, file_data, blender, parallel_mode)
+        _submit_single_scene_mode(job, blend_file, file_data, blender, parallel_mode, working_dir)
 
-    return job.send(verbose=False)
+    return job
 
 
 # ---------------------------------------------------------------------------
 # File Panel
 # ---------------------------------------------------------------------------
 
-class FilePanel(QWidget):
-    """Top section: directory browse, scan, file table."""
-    file_selected = pyqtSignal(str)  # filepath
+class FileTableModel(QAbstractTableModel):
+    """Scanned .blend files, one row per file.
+
+    Columns are kept as parallel lists indexed by row, so a status update
+    touches one slot and the view only queries the rows it actually paints.
+    Checked rows are a set of row indices.
+    """
+    check_state_changed = pyqtSignal()
 
     COL_CHECK = 0
     COL_FILENAME = 1
@@ -571,9 +1115,244 @@ class FilePanel(QWidget):
     COL_FRAMES = 3
     COL_ENGINE = 4
     COL_STATUS = 5
+    HEADERS = ("", "File", "Scene", "Frames", "Engine", "Status")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._filepaths = []
+        self._filenames = []
+        self._filenames_lower = []
+        self._file_tooltips = []
+        self._scenes = []
+        self._scene_tooltips = []
+        self._frames = []
+        self._engines = []
+        self._statuses = []
+        self._status_colors = []
+        self._checked = set()
+        self._rows = {}  # filepath -> row
+
+    def set_filepaths(self, filepaths: list):
+        """Replace all rows; every file starts checked and not inspected."""
+        n = len(filepaths)
+        self.beginResetModel()
+        self._filepaths = list(filepaths)
+        self._filenames = [os.path.basename(p) for p in self._filepaths]
+        self._filenames_lower = [_fold_case(name) for name in self._filenames]
+        self._file_tooltips = list(self._filepaths)
+        self._scenes = ["-"] * n
+        self._scene_tooltips = [""] * n
+        self._frames = ["-"] * n
+        self._engines = ["-"] * n
+        self._statuses = ["Not inspected"] * n
+        self._status_colors = [_COLOR_NEUTRAL] * n
+        self._checked = set(range(n))
+        self._rows = {p: row for row, p in enumerate(self._filepaths)}
+        self.endResetModel()
+        self.check_state_changed.emit()
+
+    def filepath(self, row: int) -> str:
+        return self._filepaths[row]
+
+    def filepaths(self) -> list:
+        return list(self._filepaths)
+
+    def filename_lower(self, row: int) -> str:
+        return self._filenames_lower[row]
+
+    def checked_filepaths(self) -> list:
+        """Checked paths in row order."""
+        paths = self._filepaths
+        if len(self._checked) == len(paths):
+            return list(paths)  # Common after a scan: everything is checked
+        return [paths[row] for row in sorted(self._checked)]
+
+    def checked_count(self) -> int:
+        return len(self._checked)
+
+    def set_checked(self, rows: list, checked: bool):
+        """Check or uncheck many rows with a single dataChanged."""
+        if not rows:
+            return
+        before = len(self._checked)
+        if checked:
+            self._checked.update(rows)
+        else:
+            self._checked.difference_update(rows)
+        if len(self._checked) == before:
+            return  # Every row was already in the requested state
+        self.dataChanged.emit(
+            self.index(min(rows), self.COL_CHECK), self.index(max(rows), self.COL_CHECK),
+            [Qt.ItemDataRole.CheckStateRole]
+        )
+        self.check_state_changed.emit()
+
+    def update_row(self, filepath: str, scene: str, frames: str, engine: str, status: str,
+                   color: QColor, scene_tooltip: str = "", file_tooltip: str = ""):
+        row = self._rows.get(filepath)
+        if row is None:
+            return
+        if file_tooltip:
+            self._file_tooltips[row] = file_tooltip
+        self._scenes[row] = scene
+        if scene_tooltip:
+            self._scene_tooltips[row] = scene_tooltip
+        self._frames[row] = frames
+        self._engines[row] = engine
+        self._statuses[row] = status
+        self._status_colors[row] = color
+        self.dataChanged.emit(self.index(row, self.COL_FILENAME), self.index(row, self.COL_STATUS))
+
+    def set_status(self, filepaths: list, status: str, color: QColor):
+        """Set the same status on many files with a single dataChanged."""
+        rows = [row for row in map(self._rows.get, filepaths) if row is not None]
+        if not rows:
+            return
+        for row in rows:
+            self._statuses[row] = status
+            self._status_colors[row] = color
+        self.dataChanged.emit(
+            self.index(min(rows), self.COL_STATUS), self.index(max(rows), self.COL_STATUS),
+            [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ForegroundRole, Qt.ItemDataRole.ToolTipRole]
+        )
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._filepaths)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index):
+        if index.column() == self.COL_CHECK:
+            return Qt.ItemFlag.ItemIsUserCheckable | Qt.ItemFlag.ItemIsEnabled
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        row, col = index.row(), index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            if col == self.COL_FILENAME:
+                return self._filenames[row]
+            if col == self.COL_SCENE:
+                return self._scenes[row]
+            if col == self.COL_FRAMES:
+                return self._frames[row]
+            if col == self.COL_ENGINE:
+                return self._engines[row]
+            if col == self.COL_STATUS:
+                return self._statuses[row]
+        elif role == Qt.ItemDataRole.CheckStateRole:
+            if col == self.COL_CHECK:
+                return Qt.CheckState.Checked if row in self._checked else Qt.CheckState.Unchecked
+        elif role == Qt.ItemDataRole.ForegroundRole:
+            if col == self.COL_STATUS:
+                return self._status_colors[row]
+        elif role == Qt.ItemDataRole.ToolTipRole:
+            if col == self.COL_FILENAME:
+                return self._file_tooltips[row]
+            if col == self.COL_SCENE:
+                return self._scene_tooltips[row] or None
+            if col == self.COL_STATUS:
+                return self._statuses[row]  # Full text visible on hover
+        elif role == Qt.ItemDataRole.UserRole:
+            return self._filepaths[row]
+        return None
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if index.column() != self.COL_CHECK or role != Qt.ItemDataRole.CheckStateRole:
+            return False
+        row = index.row()
+        if Qt.CheckState(value) == Qt.CheckState.Checked:
+            self._checked.add(row)
+        else:
+            self._checked.discard(row)
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.CheckStateRole])
+        self.check_state_changed.emit()
+        return True
+
+
+class FileFilterProxyModel(QSortFilterProxyModel):
+    """Filters FileTableModel rows by a case-insensitive filename substring.
+
+    The last verdict for every row is remembered. When the new needle
+    contains the old one (typing more), rejected rows stay rejected; when
+    the old needle contains the new one (backspace), accepted rows stay
+    accepted. Only the remaining rows get a substring test.
+    """
+    _RECHECK_ALL, _RECHECK_ACCEPTED, _RECHECK_REJECTED = range(3)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._needle = ""
+        self._accepted = []  # source row -> passed the current needle
+        self._recheck = self._RECHECK_ALL
+
+    def setSourceModel(self, model):
+        super().setSourceModel(model)
+        # Before the reset, so the proxy's own refilter sees fresh rows
+        model.modelAboutToBeReset.connect(self._forget_rows)
+
+    def _forget_rows(self):
+        self._accepted = []
+        self._recheck = self._RECHECK_ALL
+
+    def set_filter_text(self, text: str):
+        needle = _fold_case(text)
+        if needle == self._needle:
+            return  # e.g. only the case changed; the visible rows are the same
+        previous = self._needle
+        self._needle = needle
+        if len(self._accepted) != self.sourceModel().rowCount():
+            self._recheck = self._RECHECK_ALL
+        elif previous in needle:
+            self._recheck = self._RECHECK_ACCEPTED
+        elif needle in previous:
+            self._recheck = self._RECHECK_REJECTED
+        else:
+            self._recheck = self._RECHECK_ALL
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        accepted = self._accepted
+        if source_row >= len(accepted):
+            accepted.extend([True] * (source_row + 1 - len(accepted)))
+        elif self._recheck == self._RECHECK_ACCEPTED and not accepted[source_row]:
+            return False
+        elif self._recheck == self._RECHECK_REJECTED and accepted[source_row]:
+            return True
+        # Compare against the model's pre-lowercased names, no per-row lower()
+        result = not self._needle or self._needle in self.sourceModel().filename_lower(source_row)
+        accepted[source_row] = result
+        return result
+
+
+class FilePanel(QWidget):
+    """Top section: directory browse, scan, file table."""
+    file_selected = pyqtSignal(str)  # filepath
+
+    COL_CHECK = FileTableModel.COL_CHECK
+    COL_FILENAME = FileTableModel.COL_FILENAME
+    COL_SCENE = FileTableModel.COL_SCENE
+    COL_FRAMES = FileTableModel.COL_FRAMES
+    COL_ENGINE = FileTableModel.COL_ENGINE
+    COL_STATUS = FileTableModel.COL_STATUS
+
+    # Filter keystrokes arriving within this window are applied in one go
+    FILTER_DEBOUNCE_MS = 120
 
     def __init__(self):
         super().__init__()
+        self.model = FileTableModel(self)
+        self.proxy = FileFilterProxyModel(self)
+        self.proxy.setSourceModel(self.model)
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(self.FILTER_DEBOUNCE_MS)
+        self._filter_timer.timeout.connect(self._run_filter)
         self._build_ui()
 
     def _build_ui(self):
@@ -604,19 +1383,19 @@ class FilePanel(QWidget):
         row2.addWidget(QLabel("Filter:"))
         self.filter_edit = QLineEdit()
         self.filter_edit.setPlaceholderText("Type to filter files...")
-        self.filter_edit.textChanged.connect(self._apply_filter)
+        self.filter_edit.textChanged.connect(self._schedule_filter)
         row2.addWidget(self.filter_edit, 1)
         self.select_all_btn = QPushButton("Select All")
-        self.select_all_btn.clicked.connect(lambda: self._set_all_checked(True))
+        self.select_all_btn.clicked.connect(partial(self._set_all_checked, True))
         row2.addWidget(self.select_all_btn)
         self.select_none_btn = QPushButton("Select None")
-        self.select_none_btn.clicked.connect(lambda: self._set_all_checked(False))
+        self.select_none_btn.clicked.connect(partial(self._set_all_checked, False))
         row2.addWidget(self.select_none_btn)
         layout.addLayout(row2)
 
         # File table
-        self.table = QTableWidget(0, 6)
-        self.table.setHorizontalHeaderLabels(["", "File", "Scene", "Frames", "Engine", "Status"])
+        self.table = QTableView()
+        self.table.setModel(self.proxy)
         header = self.table.horizontalHeader()
         # All columns user-resizable (Interactive) except checkbox
         header.setSectionResizeMode(self.COL_CHECK, QHeaderView.ResizeMode.ResizeToContents)
@@ -633,8 +1412,8 @@ class FilePanel(QWidget):
         self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
         self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
-        self.table.cellClicked.connect(self._on_cell_clicked)
-        self.table.itemChanged.connect(self._update_inspect_button_text)
+        self.table.clicked.connect(self._on_index_clicked)
+        self.model.check_state_changed.connect(self._update_inspect_button_text)
         layout.addWidget(self.table)
 
     def _browse_directory(self):
@@ -647,117 +1426,66 @@ class FilePanel(QWidget):
         directory = self.dir_edit.text()
         if not directory or not os.path.isdir(directory):
             return
-        self.table.setRowCount(0)
-        blend_files = []
-        for root, _, files in os.walk(directory):
-            for f in sorted(files):
-                if f.endswith(".blend") and not f.endswith(".blend1"):
-                    blend_files.append(os.path.join(root, f))
-
-        for filepath in blend_files:
-            self._add_file_row(filepath)
-
-    def _add_file_row(self, filepath: str):
-        row = self.table.rowCount()
-        self.table.insertRow(row)
-
-        # Checkbox
-        chk = QTableWidgetItem()
-        chk.setFlags(Qt.ItemFlag.ItemIsUserCheckable | Qt.ItemFlag.ItemIsEnabled)
-        chk.setCheckState(Qt.CheckState.Checked)
-        self.table.setItem(row, self.COL_CHECK, chk)
-
-        # Filename
-        name_item = QTableWidgetItem(os.path.basename(filepath))
-        name_item.setToolTip(filepath)
-        name_item.setData(Qt.ItemDataRole.UserRole, filepath)
-        self.table.setItem(row, self.COL_FILENAME, name_item)
-
-        # Scene, Frames, Engine placeholders
-        self.table.setItem(row, self.COL_SCENE, QTableWidgetItem("-"))
-        self.table.setItem(row, self.COL_FRAMES, QTableWidgetItem("-"))
-        self.table.setItem(row, self.COL_ENGINE, QTableWidgetItem("-"))
-
-        # Status
-        status_item = QTableWidgetItem("Not inspected")
-        status_item.setForeground(QColor("#777"))
-        self.table.setItem(row, self.COL_STATUS, status_item)
+        # One model reset for the whole scan
+        self.model.set_filepaths(list(_iter_blend_files(directory)))
 
     def get_all_filepaths(self) -> list:
-        paths = []
-        for row in range(self.table.rowCount()):
-            item = self.table.item(row, self.COL_FILENAME)
-            if item:
-                paths.append(item.data(Qt.ItemDataRole.UserRole))
-        return paths
+        # Copy so callers can't mutate the model's list
+        return self.model.filepaths()
 
     def get_checked_filepaths(self) -> list:
-        paths = []
-        for row in range(self.table.rowCount()):
-            chk = self.table.item(row, self.COL_CHECK)
-            if chk and chk.checkState() == Qt.CheckState.Checked:
-                item = self.table.item(row, self.COL_FILENAME)
-                if item:
-                    paths.append(item.data(Qt.ItemDataRole.UserRole))
-        return paths
+        return self.model.checked_filepaths()
 
     def update_file_row(self, filepath: str, scene: str, frames: str, engine: str, status: str,
                        error: bool = False, scene_tooltip: str = "", blender_version: str = ""):
-        for row in range(self.table.rowCount()):
-            item = self.table.item(row, self.COL_FILENAME)
-            if item and item.data(Qt.ItemDataRole.UserRole) == filepath:
-                # Update filename tooltip with version info
-                if blender_version:
-                    filename_tooltip = f"{filepath}\nBlender {blender_version}"
-                    item.setToolTip(filename_tooltip)
-
-                scene_item = self.table.item(row, self.COL_SCENE)
-                scene_item.setText(scene)
-                if scene_tooltip:
-                    scene_item.setToolTip(scene_tooltip)
-                self.table.item(row, self.COL_FRAMES).setText(frames)
-                self.table.item(row, self.COL_ENGINE).setText(engine)
-                status_item = self.table.item(row, self.COL_STATUS)
-                status_item.setText(status)
-                status_item.setToolTip(status)  # Full text visible on hover
-                status_item.setForeground(QColor("#ef5350") if error else QColor("#66bb6a"))
-                break
+        # Update filename tooltip with version info
+        file_tooltip = f"{filepath}\nBlender {blender_version}" if blender_version else ""
+        self.model.update_row(filepath, scene, frames, engine, status,
+                              _COLOR_ERROR if error else _COLOR_OK, scene_tooltip, file_tooltip)
 
     def set_row_status(self, filepath: str, status: str):
-        for row in range(self.table.rowCount()):
-            item = self.table.item(row, self.COL_FILENAME)
-            if item and item.data(Qt.ItemDataRole.UserRole) == filepath:
-                status_item = self.table.item(row, self.COL_STATUS)
-                status_item.setText(status)
-                status_item.setForeground(QColor("#64b5f6"))
-                break
+        self.model.set_status([filepath], status, _COLOR_BUSY)
+
+    def set_rows_status(self, filepaths: list, status: str):
+        self.model.set_status(filepaths, status, _COLOR_BUSY)
 
     def _set_all_checked(self, checked: bool):
-        state = Qt.CheckState.Checked if checked else Qt.CheckState.Unchecked
-        for row in range(self.table.rowCount()):
-            if not self.table.isRowHidden(row):
-                item = self.table.item(row, self.COL_CHECK)
-                if item:
-                    item.setCheckState(state)
-        self._update_inspect_button_text()
+        # Only rows that pass the current filter, including a still-pending one
+        if self._filter_timer.isActive():
+            self._filter_timer.stop()
+            self._run_filter()
+        proxy = self.proxy
+        visible = proxy.rowCount()
+        if visible == self.model.rowCount():
+            rows = range(visible)  # Nothing filtered out; no per-row mapping needed
+        else:
+            rows = [proxy.mapToSource(proxy.index(r, 0)).row() for r in range(visible)]
+        self.model.set_checked(rows, checked)
+
+    def _schedule_filter(self, _text: str):
+        # Restart the window on every keystroke; only the final text is applied
+        self._filter_timer.start()
+
+    def _run_filter(self):
+        self._apply_filter(self.filter_edit.text())
 
     def _apply_filter(self, text: str):
-        text = text.lower()
-        for row in range(self.table.rowCount()):
-            item = self.table.item(row, self.COL_FILENAME)
-            if item:
-                self.table.setRowHidden(row, text not in item.text().lower())
-
-    def _on_cell_clicked(self, row: int, col: int):
-        if col == self.COL_CHECK:
+        # The proxy can report the change as many row-range removals and
+        # insertions; paint once after all of them instead of per range.
+        self.table.setUpdatesEnabled(False)
+        try:
+            self.proxy.set_filter_text(text)
+        finally:
+            self.table.setUpdatesEnabled(True)
+
+    def _on_index_clicked(self, index):
+        if index.column() == self.COL_CHECK:
             return
-        item = self.table.item(row, self.COL_FILENAME)
-        if item:
-            self.file_selected.emit(item.data(Qt.ItemDataRole.UserRole))
+        self.file_selected.emit(self.model.filepath(self.proxy.mapToSource(index).row()))
 
     def _update_inspect_button_text(self):
         """Update Inspect Selected button text with checked file count."""
-        checked_count = len(self.get_checked_filepaths())
+        checked_count = self.model.checked_count()
         if checked_count > 0:
             self.inspect_selected_btn.setText(f"Inspect Selected ({checked_count})")
         else:
@@ -833,6 +1561,12 @@ class JobSettingsTab(QWidget):
 # ---------------------------------------------------------------------------
 
 class RenderSettingsTab(QWidget):
+    _OVERRIDE_STYLESHEET = "background-color: #ff9800; color: white;"  # Orange highlight
+    _DISABLED_LAYER_TOOLTIP = (
+        "⚠️ {name} is disabled for rendering in blend file\n"
+        "(Enabling it could cause black frames with compositor nodes)"
+    )
+
     def __init__(self):
         super().__init__()
         self._updating = False
@@ -942,6 +1676,7 @@ class RenderSettingsTab(QWidget):
         self.reset_btn.setToolTip("Clear manual overrides and reload settings from blend file")
         self.reset_btn.clicked.connect(self._reset_overrides)
         self.reset_btn.setEnabled(False)  # Enabled when overrides exist
+        self._reset_highlighted = False
         reset_row.addWidget(self.reset_btn)
         reset_row.addStretch()
         layout.addRow("", reset_row)
@@ -956,18 +1691,23 @@ class RenderSettingsTab(QWidget):
 
         # Store scenes data for switching
         self._scenes_data = []
+        self._scene_by_name = {}
+        # "All Scenes" totals: per-scene frame counts and task totals per fpt
+        self._scene_frames = []
+        self._scene_frames_total = 0
+        self._scene_tasks_by_fpt = {}
 
     def _connect_override_tracking(self):
         """Connect widget signals to track user overrides."""
         # Frame range overrides
-        self.frame_start_spin.valueChanged.connect(lambda: self._mark_override("frame_start"))
-        self.frame_end_spin.valueChanged.connect(lambda: self._mark_override("frame_end"))
-        self.frame_step_spin.valueChanged.connect(lambda: self._mark_override("frame_step"))
-        self.fpt_spin.valueChanged.connect(lambda: self._mark_override("frames_per_task"))
+        self.frame_start_spin.valueChanged.connect(partial(self._mark_override, "frame_start"))
+        self.frame_end_spin.valueChanged.connect(partial(self._mark_override, "frame_end"))
+        self.frame_step_spin.valueChanged.connect(partial(self._mark_override, "frame_step"))
+        self.fpt_spin.valueChanged.connect(partial(self._mark_override, "frames_per_task"))
 
         # Output overrides
-        self.output_edit.textChanged.connect(lambda: self._mark_override("output_path"))
-        self.format_combo.currentTextChanged.connect(lambda: self._mark_override("output_format"))
+        self.output_edit.textChanged.connect(partial(self._mark_override, "output_path"))
+        self.format_combo.currentTextChanged.connect(partial(self._mark_override, "output_format"))
 
         # Note: selected_scene and selected_layers are handled separately as they're
         # user selections by nature, not overrides
@@ -978,8 +1718,16 @@ class RenderSettingsTab(QWidget):
         if not self._updating and self._current_file_data:
             self._current_file_data.user_overrides.add(field_name)
             # Enable reset button when overrides exist
-            self.reset_btn.setEnabled(True)
-            self.reset_btn.setStyleSheet("background-color: #ff9800; color: white;")  # Orange highlight
+            self._set_reset_highlight(True)
+
+    def _set_reset_highlight(self, active: bool):
+        """Enable and highlight the reset button, or disable and clear it."""
+        # Every edit lands here; re-applying the same stylesheet would re-polish the button
+        if active == self._reset_highlighted:
+            return
+        self._reset_highlighted = active
+        self.reset_btn.setEnabled(active)
+        self.reset_btn.setStyleSheet(self._OVERRIDE_STYLESHEET if active else "")
 
     def _reset_overrides(self):
         """Clear all user overrides and reload settings from file."""
@@ -993,13 +1741,19 @@ class RenderSettingsTab(QWidget):
         self.populate_from_file(self._current_file_data)
 
         # Disable reset button
-        self.reset_btn.setEnabled(False)
-        self.reset_btn.setStyleSheet("")  # Reset style
+        self._set_reset_highlight(False)
 
     def populate_from_file(self, file_data: BlendFileData):
         self._updating = True
         self._current_file_data = file_data  # Store reference for override tracking
         self._scenes_data = file_data.scenes
+        self._scene_by_name = {sc["name"]: sc for sc in reversed(file_data.scenes)}
+        self._scene_frames = [
+            self._frame_count(sc.get("frame_start", 1), sc.get("frame_end", 250), sc.get("frame_step", 1))
+            for sc in file_data.scenes
+        ]
+        self._scene_frames_total = sum(self._scene_frames)
+        self._scene_tasks_by_fpt = {}
         overrides = file_data.user_overrides
 
         # Populate scene combo (always update - scene selection is not overrideable)
@@ -1045,12 +1799,7 @@ class RenderSettingsTab(QWidget):
         self._populate_layers(file_data.selected_layers)
 
         # Update reset button state
-        if overrides:
-            self.reset_btn.setEnabled(True)
-            self.reset_btn.setStyleSheet("background-color: #ff9800; color: white;")
-        else:
-            self.reset_btn.setEnabled(False)
-            self.reset_btn.setStyleSheet("")
+        self._set_reset_highlight(bool(overrides))
 
         # Set parallel rendering checkbox
         self.parallel_layers_check.setChecked(file_data.render_layers_parallel)
@@ -1059,7 +1808,6 @@ class RenderSettingsTab(QWidget):
         self._update_calculated()
 
     def _populate_layers(self, selected_layers: list):
-        self.layers_list.clear()
         scene_name = self.scene_combo.currentText()
 
         # Special handling for "All Scenes"
@@ -1067,41 +1815,48 @@ class RenderSettingsTab(QWidget):
             # Show note that all scene layers will be rendered
             item = QListWidgetItem("(All scenes & layers will be rendered)")
             item.setFlags(Qt.ItemFlag.NoItemFlags)  # Not selectable
-            self.layers_list.addItem(item)
-            self._update_layer_button_state()
-            return
-
-        scene_data = next((s for s in self._scenes_data if s["name"] == scene_name), None)
-        if scene_data and scene_data.get("view_layers"):
-            for layer_data in scene_data["view_layers"]:
-                layer_name = layer_data.get("name", "")
-                layer_use = layer_data.get("use", True)  # Is this layer enabled for rendering?
-
-                item = QListWidgetItem(layer_name)
-
-                if layer_use:
-                    # Layer is enabled: make it checkable
-                    item.setFlags(item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
-                    # Auto-check if in selected_layers or no layers selected yet
-                    should_check = layer_name in selected_layers or not selected_layers
-                    item.setCheckState(
-                        Qt.CheckState.Checked if should_check else Qt.CheckState.Unchecked
-                    )
-                else:
-                    # Layer is DISABLED: make it NOT checkable to prevent black frame renders
-                    # Remove checkable flag so user cannot accidentally enable it
-                    item.setFlags(Qt.ItemFlag.ItemIsEnabled)  # Can see but not interact
-                    item.setForeground(QColor("#888"))  # Gray out disabled layers
-                    item.setToolTip(
-                        f"⚠️ {layer_name} is disabled for rendering in blend file\n"
-                        f"(Enabling it could cause black frames with compositor nodes)"
-                    )
-
+            items = [item]
+        else:
+            scene_data = self._scene_by_name.get(scene_name)
+            view_layers = scene_data.get("view_layers") if scene_data else None
+            # Auto-check layers in selected_layers, or all if none selected yet
+            check_all = not selected_layers
+            selected_set = set(selected_layers)
+            items = [self._make_layer_item(layer_data, check_all, selected_set)
+                     for layer_data in view_layers or ()]
+
+        # Items are finished before insertion; swap the list contents with a
+        # single repaint instead of one per clear/addItem.
+        self.layers_list.setUpdatesEnabled(False)
+        try:
+            self.layers_list.clear()
+            for item in items:
                 self.layers_list.addItem(item)
+        finally:
+            self.layers_list.setUpdatesEnabled(True)
 
         # Update button state at the end
         self._update_layer_button_state()
 
+    def _make_layer_item(self, layer_data: dict, check_all: bool, selected_set: set) -> QListWidgetItem:
+        layer_name = layer_data.get("name", "")
+        item = QListWidgetItem(layer_name)
+
+        if layer_data.get("use", True):  # Is this layer enabled for rendering?
+            # Layer is enabled: make it checkable
+            item.setFlags(item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
+            should_check = check_all or layer_name in selected_set
+            item.setCheckState(
+                Qt.CheckState.Checked if should_check else Qt.CheckState.Unchecked
+            )
+        else:
+            # Layer is DISABLED: make it NOT checkable to prevent black frame renders
+            # Remove checkable flag so user cannot accidentally enable it
+            item.setFlags(Qt.ItemFlag.ItemIsEnabled)  # Can see but not interact
+            item.setForeground(_COLOR_DISABLED)  # Gray out disabled layers
+            item.setToolTip(self._DISABLED_LAYER_TOOLTIP.format(name=layer_name))
+        return item
+
     def _check_all_layers(self):
         """Check all view layers in the list."""
         for i in range(self.layers_list.count()):
@@ -1151,7 +1906,7 @@ class RenderSettingsTab(QWidget):
             self._update_calculated()
             return
         
-        scene_data = next((s for s in self._scenes_data if s["name"] == scene_name), None)
+        scene_data = self._scene_by_name.get(scene_name)
         if scene_data:
             self.frame_start_spin.setValue(scene_data["frame_start"])
             self.frame_end_spin.setValue(scene_data["frame_end"])
@@ -1175,25 +1930,24 @@ class RenderSettingsTab(QWidget):
         if not self._updating and self._current_file_data:
             self._current_file_data.render_layers_parallel = self.parallel_layers_check.isChecked()
 
+    @staticmethod
+    def _frame_count(start: int, end: int, step: int) -> int:
+        return max(0, (end - start) // step + 1) if step > 0 else 0
+
     def _update_calculated(self):
         scene_name = self.scene_combo.currentText()
         
         # Special calculation for All Scenes
         if scene_name == "⚡ All Scenes":
-            total_frames_all = 0
-            total_tasks_all = 0
+            # Frame counts are fixed per file; only the task total depends on fpt
             fpt = self.fpt_spin.value()
-            
-            for scene in self._scenes_data:
-                start = scene.get("frame_start", 1)
-                end = scene.get("frame_end", 250)
-                step = scene.get("frame_step", 1)
-                frames = max(0, (end - start) // step + 1) if step > 0 else 0
-                tasks = math.ceil(frames / fpt) if fpt > 0 and frames > 0 else 0
-                total_frames_all += frames
-                total_tasks_all += tasks
-            
-            self.total_frames_label.setText(f"{total_frames_all} (all scenes)")
+            total_tasks_all = self._scene_tasks_by_fpt.get(fpt)
+            if total_tasks_all is None:
+                total_tasks_all = sum(math.ceil(frames / fpt) for frames in self._scene_frames if frames > 0) \
+                    if fpt > 0 else 0
+                self._scene_tasks_by_fpt[fpt] = total_tasks_all
+
+            self.total_frames_label.setText(f"{self._scene_frames_total} (all scenes)")
             self.total_tasks_label.setText(f"{total_tasks_all} (all scenes)")
         else:
             # Single scene calculation
@@ -1201,7 +1955,7 @@ class RenderSettingsTab(QWidget):
             end = self.frame_end_spin.value()
             step = self.frame_step_spin.value()
             fpt = self.fpt_spin.value()
-            total_frames = max(0, (end - start) // step + 1) if step > 0 else 0
+            total_frames = self._frame_count(start, end, step)
             total_tasks = math.ceil(total_frames / fpt) if fpt > 0 else 0
             self.total_frames_label.setText(str(total_frames))
             self.total_tasks_label.setText(str(total_tasks))
@@ -1252,6 +2006,7 @@ class AppSettingsTab(QWidget):
         self.cleanup_jobid_combo.setInsertPolicy(QComboBox.InsertPolicy.NoInsert)
         self.cleanup_jobid_combo.setMinimumWidth(100)
         self.cleanup_jobid_combo.setPlaceholderText("Job ID")
+        self._jobid_cache = JobIdCache(self)
         self._build_ui()
         # Connect signal for auto job_id detection (only once, after UI is built)
         self.cleanup_blend_combo.currentTextChanged.connect(self._auto_detect_job_ids)
@@ -1294,6 +2049,8 @@ class AppSettingsTab(QWidget):
 
     def _reload_job_ids(self):
         blend_path = self.cleanup_blend_combo.currentText().strip()
+        # Explicit reload always rescans (watchers can miss changes on network shares)
+        self._jobid_cache.invalidate(blend_path)
         self._auto_detect_job_ids(blend_path)
         
     def update_cleanup_blend_list(self, blend_filepaths: list):
@@ -1304,7 +2061,6 @@ class AppSettingsTab(QWidget):
             self.cleanup_jobid_combo.clear()
 
     def _auto_detect_job_ids(self, blend_path):
-        import re
         if not hasattr(self, 'cleanup_jobid_combo'):
             return
         self.cleanup_jobid_combo.clear()
@@ -1312,21 +2068,10 @@ class AppSettingsTab(QWidget):
         if not blend_path or not os.path.isfile(blend_path):
             self.cleanup_jobid_combo.addItem("No job_id found")
             return
-        blend_dir = os.path.dirname(blend_path)
-        job_id_dir = os.path.join(blend_dir, "job_id")
-        job_name = os.path.basename(blend_path).replace(".blend", "")
-        if not os.path.isdir(job_id_dir):
-            self.cleanup_jobid_combo.addItem("No job_id found")
-            return
-        job_ids = []
-        for fname in os.listdir(job_id_dir):
-            if fname.startswith(job_name + "_jobID_") and fname.endswith(".txt"):
-                m = re.match(rf"{re.escape(job_name)}_jobID_(.+)\.txt", fname)
-                if m:
-                    job_ids.append(m.group(1))
+        job_ids = self._jobid_cache.job_ids(blend_path)
         if job_ids:
             self.cleanup_jobid_combo.clear()
-            self.cleanup_jobid_combo.addItems(sorted(job_ids, key=lambda x: (0, int(x)) if x.isdigit() else (1, x)))
+            self.cleanup_jobid_combo.addItems(job_ids)
             self.cleanup_jobid_combo.setCurrentIndex(0)
         else:
             self.cleanup_jobid_combo.clear()
@@ -1374,6 +2119,67 @@ class AppSettingsTab(QWidget):
 # Job Log Viewer Dialog
 # ---------------------------------------------------------------------------
 
+class LogHighlighter(QSyntaxHighlighter):
+    """Colours task output line by line as the log view lays it out.
+
+    Only blocks that are (re)laid out get highlighted, so a large log costs
+    nothing up front beyond the plain text itself.
+    """
+    COLOR_FRAME   = "#64b5f6"   # blue   — Fra:\d+
+    COLOR_ERROR   = "#ef5350"   # red    — Error / Traceback / CRITICAL
+    COLOR_WARN    = "#ffb300"   # amber  — Warning / WARN
+    COLOR_OK      = "#66bb6a"   # green  — Time / Mem / Finished / render
+    COLOR_CRASH   = "#ff6e40"   # orange — crash.txt header
+    COLOR_DEFAULT = "#b0b0b0"   # gray   — everything else
+
+    # Markers in precedence order, so that a line with several of them
+    # (e.g. "Fra:12 ... Error") keeps the colour of the most important one.
+    _MARKERS = (
+        ("crash", r"=== crash\.txt ===", COLOR_CRASH),
+        ("error", r"error|traceback|critical", COLOR_ERROR),
+        ("warn", r"warning|warn\b", COLOR_WARN),
+        ("frame", r"Fra:\d+", COLOR_FRAME),
+        ("ok", r"Time:|Mem:|Finished|render", COLOR_OK),
+    )
+    # One pass finds the first marker on the line, if any
+    _PAT_ALL = re.compile(
+        "|".join(f"(?P<{name}>{pat})" for name, pat, _ in _MARKERS), re.IGNORECASE
+    )
+    _RANK = {name: rank for rank, (name, _, _) in enumerate(_MARKERS)}
+    _SEARCHES = tuple(re.compile(pat, re.IGNORECASE).search for _, pat, _ in _MARKERS)
+    _COLORS = tuple(color for _, _, color in _MARKERS)
+
+    def __init__(self, document):
+        super().__init__(document)
+        self._formats = {}
+        for color in (self.COLOR_FRAME, self.COLOR_ERROR, self.COLOR_WARN,
+                      self.COLOR_OK, self.COLOR_CRASH):
+            fmt = QTextCharFormat()
+            fmt.setForeground(QColor(color))
+            self._formats[color] = fmt
+
+    def line_color(self, line: str) -> str:
+        m = self._PAT_ALL.search(line)
+        if m is None:
+            return self.COLOR_DEFAULT
+        # A scan consumes what it matches, so overlapping markers hide each
+        # other ("renderror" reads as "render"); ask each more important
+        # pattern directly instead of reading on.
+        rank = self._RANK[m.lastgroup]
+        searches = self._SEARCHES
+        for i in range(rank):
+            if searches[i](line):
+                return self._COLORS[i]
+        return self._COLORS[rank]
+
+    def highlightBlock(self, text: str):
+        color = self.line_color(text)
+        # Default-coloured lines (most of a log) already get the view's own
+        # text colour; leaving them unformatted keeps their layouts run-free.
+        if color != self.COLOR_DEFAULT:
+            self.setFormat(0, len(text), self._formats[color])
+
+
 class JobLogDialog(QDialog):
     """Standalone dialog for viewing Afanasy render job terminal output.
 
@@ -1385,6 +2191,26 @@ class JobLogDialog(QDialog):
         5. Choose output filter (full / errors only + crash.txt)
         6. View color-highlighted output with copy/save/find/auto-refresh
     """
+    # Line cap for the output pane while "Limit to last N lines" is on
+    OUTPUT_MAX_LINES = 5000
+    # Lines inserted per event-loop pass when filling the pane with a big log
+    RENDER_CHUNK_LINES = 2000
+    # Only the tail of crash.txt is shown; the end is where the crash is
+    CRASH_MAX_BYTES = 256 * 1024
+    # Quiet period after typing in the file combo before job_id/ is rescanned
+    FILE_DEBOUNCE_MS = 250
+    # Outputs at least this long are filtered on a worker thread
+    FILTER_THREAD_MIN_CHARS = 256 * 1024
+    # Auto-refresh period; doubles while the job shows no progress, up to the max
+    REFRESH_INTERVAL_MS = 10000
+    REFRESH_MAX_INTERVAL_MS = 60000
+
+    # Output filter patterns, compiled once rather than on every refresh
+    _PAT_ERRORS = re.compile(r"(error|traceback|exception|fatal|critical)", re.IGNORECASE)
+    _PAT_WARNINGS = re.compile(r"(warning|warn\b)", re.IGNORECASE)
+    _PAT_TIME = re.compile(r"^\s*Time:\s+\d+", re.IGNORECASE)
+    # Line breaks other than \n / \r\n that splitlines() also honours
+    _ODD_LINE_BREAKS = ("\x0b", "\x0c", "\x1c", "\x1d", "\x1e")
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -1396,13 +2222,43 @@ class JobLogDialog(QDialog):
         self._scanned_files = []       # blend file paths from main window
         self._current_job_id = None    # currently loaded job ID (int)
         self._fetch_thread = None      # active JobFetchThread
-        self._refresh_threads = []     # list of threads for auto-refresh (prevent garbage collection)
+        self._refresh_pool = QThreadPool(self)  # reused by every auto-refresh
+        self._refresh_pool.setMaxThreadCount(2)
+        self._refresh_in_flight = 0    # refresh fetches not yet finished
         self._refresh_timer = QTimer(self)
-        self._refresh_timer.setInterval(10000)  # 10 s
+        self._refresh_timer.setInterval(self.REFRESH_INTERVAL_MS)
+        self._last_status = None       # (tasks done, state) from the last job info
         self._refresh_timer.timeout.connect(self._refresh)
+        self._file_timer = QTimer(self)
+        self._file_timer.setSingleShot(True)
+        self._file_timer.setInterval(self.FILE_DEBOUNCE_MS)
+        self._file_timer.timeout.connect(self._reload_job_ids)
 
         # Map (scene_str, layer_str) → (block_num, task_count)
         self._scene_layer_map = {}
+        # (job_id, map items) the combo was last built from
+        self._scene_layer_key = None
+        # _scene_layer_map entry for the block selected in scene_combo
+        self._current_block_info = None
+
+        # crash.txt path → ((mtime_ns, size), formatted text)
+        self._crash_cache = {}
+        # Sorted job IDs per blend; the Reload IDs button bypasses it
+        self._job_ids_cache = JobIdCache(self)
+        # Filtered output currently in the pane (None while a message is shown)
+        self._shown_output = None
+        # (job_id, block_num, task_num) of the last requested task output
+        self._output_key = None
+        # (full output text, its splitlines()) — shared by every filter mode
+        self._split_cache = ("", [])
+        self._filter_threads = []      # OutputFilterThreads still running
+        self._filter_generation = 0    # bumped per output shown; stale results are dropped
+        # Lines still to be inserted by _render_next_chunk, and where to resume
+        self._pending_lines = None
+        self._pending_pos = 0
+        self._render_timer = QTimer(self)
+        self._render_timer.setInterval(0)
+        self._render_timer.timeout.connect(self._render_next_chunk)
 
         self._build_ui()
 
@@ -1423,8 +2279,11 @@ class JobLogDialog(QDialog):
         self.file_combo.setEditable(True)
         self.file_combo.setInsertPolicy(QComboBox.InsertPolicy.NoInsert)
         self.file_combo.setMinimumWidth(280)
+        self.file_combo.view().setUniformItemSizes(True)
         self.file_combo.setPlaceholderText("Select or browse .blend file…")
         self.file_combo.currentTextChanged.connect(self._on_file_changed)
+        # Picking from the list (not typing) needs no debounce
+        self.file_combo.activated.connect(self._reload_job_ids)
         top_row.addWidget(self.file_combo, 2)
 
         self.file_browse_btn = QPushButton("Browse…")
@@ -1439,11 +2298,12 @@ class JobLogDialog(QDialog):
         self.job_id_combo.setInsertPolicy(QComboBox.InsertPolicy.NoInsert)
         self.job_id_combo.setMinimumWidth(100)
         self.job_id_combo.setPlaceholderText("ID…")
+        self.job_id_combo.view().setUniformItemSizes(True)
         top_row.addWidget(self.job_id_combo, 1)
 
         self.refresh_ids_btn = QPushButton("Reload IDs")
         self.refresh_ids_btn.setFixedWidth(80)
-        self.refresh_ids_btn.clicked.connect(self._reload_job_ids)
+        self.refresh_ids_btn.clicked.connect(self._rescan_job_ids)
         top_row.addWidget(self.refresh_ids_btn)
 
         self.load_job_btn = QPushButton("Load Job")
@@ -1484,6 +2344,7 @@ class JobLogDialog(QDialog):
         self.scene_combo = QComboBox()
         self.scene_combo.setPlaceholderText("— load job first —")
         self.scene_combo.setEnabled(False)
+        self.scene_combo.view().setUniformItemSizes(True)
         self.scene_combo.currentTextChanged.connect(self._on_scene_changed)
         filter_layout.addWidget(self.scene_combo)
 
@@ -1520,6 +2381,21 @@ class JobLogDialog(QDialog):
         )
         filter_layout.addWidget(self.crash_check)
 
+        self.limit_lines_check = QCheckBox(f"Limit to last {self.OUTPUT_MAX_LINES} lines")
+        self.limit_lines_check.setChecked(True)
+        self.limit_lines_check.setToolTip(
+            "Keep only the newest lines in the view so huge logs stay responsive.\n"
+            "Uncheck to see (and copy/save) the complete output."
+        )
+        self.limit_lines_check.toggled.connect(self._on_limit_lines_toggled)
+        filter_layout.addWidget(self.limit_lines_check)
+
+        self.colorize_check = QCheckBox("Colorize")
+        self.colorize_check.setChecked(True)
+        self.colorize_check.setToolTip("Colour errors, warnings, frames and timings in the output")
+        self.colorize_check.toggled.connect(self._on_colorize_toggled)
+        filter_layout.addWidget(self.colorize_check)
+
         filter_layout.addSpacing(8)
         filter_layout.addWidget(QLabel("Job status:"))
         self.status_label = QLabel("—")
@@ -1536,14 +2412,19 @@ class JobLogDialog(QDialog):
         output_layout.setContentsMargins(0, 0, 0, 0)
         output_layout.setSpacing(4)
 
-        self.output_edit = QTextEdit()
+        # Plain text + highlighter: task logs can be many MB, which rich-text
+        # HTML layout in a QTextEdit does not cope with.
+        self.output_edit = QPlainTextEdit()
         self.output_edit.setReadOnly(True)
         mono = QFont("Monospace", 9)
         mono.setStyleHint(QFont.StyleHint.Monospace)
         self.output_edit.setFont(mono)
         self.output_edit.setStyleSheet(
-            "QTextEdit { background-color: #1e1e1e; color: #b0b0b0; border: 1px solid #333; }"
+            "QPlainTextEdit { background-color: #1e1e1e; "
+            f"color: {LogHighlighter.COLOR_DEFAULT}; border: 1px solid #333; }}"
         )
+        self.output_edit.setMaximumBlockCount(self.OUTPUT_MAX_LINES)
+        self._highlighter = LogHighlighter(self.output_edit.document())
         output_layout.addWidget(self.output_edit)
 
         # Find / copy / save toolbar
@@ -1582,12 +2463,16 @@ class JobLogDialog(QDialog):
 
     def populate_files(self, blend_files: list):
         """Populate the file combo from the main window's scanned file list."""
+        if blend_files == self._scanned_files:
+            return  # reopened with the same scan; keep the current selection
         self._scanned_files = blend_files
+        self.file_combo.setUpdatesEnabled(False)
         self.file_combo.blockSignals(True)
         self.file_combo.clear()
         self.file_combo.addItems(blend_files)
         self.file_combo.setCurrentIndex(-1)
         self.file_combo.blockSignals(False)
+        self.file_combo.setUpdatesEnabled(True)
 
     # ------------------------------------------------------------------
     # File selection
@@ -1603,49 +2488,45 @@ class JobLogDialog(QDialog):
             if self.file_combo.findText(path) == -1:
                 self.file_combo.addItem(path)
             self.file_combo.setCurrentText(path)
+            self._reload_job_ids()
 
-    def _on_file_changed(self, path: str):
-        self._populate_job_ids(path.strip())
+    def _on_file_changed(self, _path: str):
+        # Restart the window on every keystroke; only the final path is scanned
+        self._file_timer.start()
 
     def _reload_job_ids(self):
+        self._file_timer.stop()
         self._populate_job_ids(self.file_combo.currentText().strip())
 
+    def _rescan_job_ids(self):
+        # Explicit reload always rescans (watchers can miss changes on network shares)
+        self._job_ids_cache.invalidate(self.file_combo.currentText().strip())
+        self._reload_job_ids()
+
     def _populate_job_ids(self, blend_path: str):
-        import re
+        self.job_id_combo.setUpdatesEnabled(False)
         self.job_id_combo.blockSignals(True)
         self.job_id_combo.clear()
         self.no_ids_label.setVisible(False)
 
-        if not blend_path or not os.path.isfile(blend_path):
-            self.job_id_combo.blockSignals(False)
-            return
-
-        blend_dir = os.path.dirname(blend_path)
-        job_id_dir = os.path.join(blend_dir, "job_id")
-        job_name = os.path.basename(blend_path).replace(".blend", "")
-
-        job_ids = []
-        if os.path.isdir(job_id_dir):
-            for fname in os.listdir(job_id_dir):
-                if fname.startswith(job_name + "_jobID_") and fname.endswith(".txt"):
-                    m = re.match(rf"{re.escape(job_name)}_jobID_(.+)\.txt", fname)
-                    if m:
-                        job_ids.append(m.group(1))
-
-        if job_ids:
-            job_ids_sorted = sorted(job_ids, key=lambda x: (0, int(x)) if x.isdigit() else (1, x))
-            self.job_id_combo.addItems(job_ids_sorted)
-            self.job_id_combo.setCurrentIndex(0)
-        else:
-            self.no_ids_label.setVisible(True)
+        if blend_path and os.path.isfile(blend_path):
+            job_ids = self._job_ids_cache.job_ids(blend_path)
+            if job_ids:
+                self.job_id_combo.addItems(job_ids)
+                self.job_id_combo.setCurrentIndex(0)
+            else:
+                self.no_ids_label.setVisible(True)
 
         self.job_id_combo.blockSignals(False)
+        self.job_id_combo.setUpdatesEnabled(True)
 
     # ------------------------------------------------------------------
     # Job loading
     # ------------------------------------------------------------------
 
     def _on_load_job_clicked(self):
+        if self._file_timer.isActive():
+            self._reload_job_ids()  # Don't load an ID listed for the previous path
         raw = self.job_id_combo.currentText().strip()
         if not raw or not raw.isdigit():
             self._show_load_error("Please enter a numeric Job ID.")
@@ -1654,8 +2535,10 @@ class JobLogDialog(QDialog):
         job_id = int(raw)
         self._current_job_id = job_id
         self._job_data = None
+        self._scene_layer_key = None  # explicit load always rebuilds the block combo
+        self._reset_refresh_backoff()
         self._hide_load_error()
-        self.output_edit.setPlainText("Loading job info…")
+        self._show_message("Loading job info…")
         self.load_job_btn.setEnabled(False)
 
         self._fetch_thread = JobFetchThread(job_id, "job_info")
@@ -1667,9 +2550,20 @@ class JobLogDialog(QDialog):
     def _on_job_loaded(self, data: dict):
         self._job_data = data
         self._hide_load_error()
-        self._populate_scene_layer(data)
+        if self._populate_scene_layer(data):
+            self._show_message("Job loaded. Select a block and task #, then click Show Output.")
         self._update_status_label(data)
-        self.output_edit.setPlainText("Job loaded. Select a block and task #, then click Show Output.")
+
+        # Poll less often while nothing changes; snap back on progress
+        status = (data.get("tasks_done_num", data.get("tasksdonenum")),
+                  data.get("state_str", data.get("state")))
+        if status == self._last_status:
+            interval = min(self.REFRESH_MAX_INTERVAL_MS, self._refresh_timer.interval() * 2)
+        else:
+            interval = self.REFRESH_INTERVAL_MS
+        self._last_status = status
+        if interval != self._refresh_timer.interval():
+            self._refresh_timer.setInterval(interval)
 
         # Stop auto-refresh if job is finished
         state = str(data.get("state_str", data.get("state", ""))).upper()
@@ -1679,7 +2573,7 @@ class JobLogDialog(QDialog):
 
     def _on_job_load_error(self, msg: str):
         self._show_load_error(msg)
-        self.output_edit.setPlainText(
+        self._show_message(
             f"Error: {msg}\n\nCheck the Job ID and ensure the Afanasy server is reachable."
         )
 
@@ -1700,8 +2594,12 @@ class JobLogDialog(QDialog):
         _scene_layer_map: block_name → (block_num, task_count)
         The block name (e.g. 'Main_AllLayers', 'Dome[Dome]') is shown as-is —
         users select which block to view output for; no layer-level splitting.
+
+        Returns False when the job and its blocks are unchanged since the last
+        call (the usual auto-refresh case); the combo and the user's current
+        selection are then left alone.
         """
-        self._scene_layer_map = {}
+        scene_layer_map = {}
 
         blocks_raw = job_data.get("blocks", [])
         if not isinstance(blocks_raw, (list, tuple)):
@@ -1717,11 +2615,19 @@ class JobLogDialog(QDialog):
                 task_count = getattr(block, "tasks_num",
                                      getattr(block, "tasksnumber", 1))
 
-            self._scene_layer_map[block_name] = (
+            scene_layer_map[block_name] = (
                 block_num, int(task_count) if task_count else 1
             )
             block_names.append(block_name)
 
+        layout_key = (self._current_job_id, tuple(scene_layer_map.items()))
+        if layout_key == self._scene_layer_key:
+            return False
+        self._scene_layer_key = layout_key
+        self._scene_layer_map = scene_layer_map
+        self._current_block_info = None
+
+        self.scene_combo.setUpdatesEnabled(False)
         self.scene_combo.blockSignals(True)
         self.scene_combo.clear()
         self.scene_combo.addItems(block_names)
@@ -1729,16 +2635,18 @@ class JobLogDialog(QDialog):
         if block_names:
             self.scene_combo.setCurrentIndex(0)
         self.scene_combo.blockSignals(False)
+        self.scene_combo.setUpdatesEnabled(True)
 
         # Manually trigger max update for the first block (signals were blocked)
         if block_names:
             self._on_scene_changed(block_names[0])
 
         self.show_output_btn.setEnabled(bool(block_names))
+        return True
 
     def _on_scene_changed(self, block_name: str):
         """Update task spinbox maximum when the selected block changes."""
-        info = self._scene_layer_map.get(block_name)
+        info = self._current_block_info = self._scene_layer_map.get(block_name)
         if info:
             _, task_count = info
             self.task_spin.setMaximum(max(0, task_count - 1))
@@ -1763,12 +2671,11 @@ class JobLogDialog(QDialog):
     # ------------------------------------------------------------------
 
     def _on_show_output_clicked(self):
-        block_name = self.scene_combo.currentText()
         task_num = self.task_spin.value()
 
-        info = self._scene_layer_map.get(block_name)
+        info = self._current_block_info
         if info is None:
-            self.output_edit.setPlainText("No block found for the selected scene.")
+            self._show_message("No block found for the selected scene.")
             return
 
         block_num, _ = info
@@ -1777,7 +2684,12 @@ class JobLogDialog(QDialog):
     def _fetch_task_output(self, block_num: int, task_num: int):
         if not self._current_job_id:
             return
-        self.output_edit.setPlainText("Fetching task output…")
+        key = (self._current_job_id, block_num, task_num)
+        if key != self._output_key or self._shown_output is None:
+            self._show_message("Fetching task output…")
+        # else: re-fetching the task on screen; keep it up so the result can
+        # be diffed against it instead of rebuilding the whole document
+        self._output_key = key
         self.show_output_btn.setEnabled(False)
 
         thread = JobFetchThread(self._current_job_id, "task_output",
@@ -1790,7 +2702,7 @@ class JobLogDialog(QDialog):
 
     def _on_output_loaded(self, text: str):
         if not text:
-            self.output_edit.setPlainText(
+            self._show_message(
                 "No output yet — task may still be waiting or running."
             )
             return
@@ -1804,74 +2716,222 @@ class JobLogDialog(QDialog):
 
         # Apply selected filter
         if self.radio_errors.isChecked():
-            display = self._filter_errors_only(full_text)
+            filter_func = self._filter_errors_only
         elif self.radio_warnings.isChecked():
-            display = self._filter_warnings_only(full_text)
+            filter_func = self._filter_warnings_only
         elif self.radio_saved.isChecked():
-            display = self._filter_saved_files(full_text)
+            filter_func = self._filter_saved_files
         elif self.radio_frames.isChecked():
-            display = self._filter_frame_summary(full_text)
+            filter_func = self._filter_frame_summary
         else:
-            display = full_text
+            filter_func = None
 
-        # Render as color-highlighted HTML
-        self.output_edit.setHtml(self._highlight_output(display))
+        self._filter_generation += 1
+        if filter_func is None:
+            self._show_output(full_text)
+        elif len(full_text) < self.FILTER_THREAD_MIN_CHARS:
+            self._show_output(filter_func(full_text, self._split_lines(full_text)))
+        else:
+            # Big log: filter in the background and keep the dialog responsive
+            thread = OutputFilterThread(filter_func, full_text, self._filter_generation)
+            thread.filtered.connect(self._on_output_filtered)
+            thread.finished.connect(self._cleanup_filter_threads)
+            thread.start()
+            self._filter_threads.append(thread)
+
+    def _on_output_filtered(self, generation: int, display: str):
+        if generation == self._filter_generation:  # else superseded; drop it
+            self._show_output(display)
+
+    def _cleanup_filter_threads(self):
+        self._filter_threads = [t for t in self._filter_threads if t.isRunning()]
+
+    def _show_output(self, display: str):
+        """Show filtered task output, reusing what is already on screen."""
+        # Colours are applied by the attached LogHighlighter
+        shown = self._shown_output
+        if display == shown:
+            return  # Auto-refresh with no new output: leave the view alone
+        # A growing log is progress even while the job status stands still
+        self._reset_refresh_backoff()
+        if shown and self._pending_lines is None and display.startswith(shown):
+            # The task log only grew: lay out just the new tail
+            cursor = QTextCursor(self.output_edit.document())
+            cursor.movePosition(QTextCursor.MoveOperation.End)
+            cursor.insertText(display[len(shown):])
+            self._scroll_output_to_bottom()
+        else:
+            self._set_output_text(display)
+        self._shown_output = display
 
-        # Scroll to bottom
+    def _on_output_error(self, msg: str):
+        self._show_message(f"Error fetching output:\n{msg}")
+
+    def _on_colorize_toggled(self, checked: bool):
+        # Detaching the highlighter leaves the text as plain, uncoloured layout
+        self._highlighter.setDocument(self.output_edit.document() if checked else None)
+
+    def _show_message(self, text: str):
+        """Replace the output pane with a status/error message."""
+        self._shown_output = None
+        self._filter_generation += 1  # a filter still running is now stale
+        self._cancel_render()
+        self.output_edit.setPlainText(text)
+
+    def _set_output_text(self, text: str):
+        """Replace the pane's contents, filling big outputs over several
+        event-loop passes so the dialog keeps responding while they load."""
+        self._cancel_render()
+        chunk = self.RENDER_CHUNK_LINES
+        lines = text.split("\n")
+        if self.limit_lines_check.isChecked() and len(lines) > self.OUTPUT_MAX_LINES:
+            # The block cap would discard these anyway; don't lay them out
+            lines = lines[-self.OUTPUT_MAX_LINES:]
+        elif len(lines) <= chunk:
+            self.output_edit.setPlainText(text)
+            self._scroll_output_to_bottom()
+            return
+        self.output_edit.setPlainText("\n".join(lines[:chunk]))
+        self._scroll_output_to_bottom()
+        if len(lines) > chunk:
+            self._pending_lines = lines
+            self._pending_pos = chunk
+            self._render_timer.start()
+
+    def _render_next_chunk(self):
+        lines = self._pending_lines
+        if lines is None:
+            self._render_timer.stop()
+            return
+        start = self._pending_pos
+        end = start + self.RENDER_CHUNK_LINES
+        cursor = QTextCursor(self.output_edit.document())
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.insertText("\n" + "\n".join(lines[start:end]))
+        self._scroll_output_to_bottom()
+        if end >= len(lines):
+            self._cancel_render()
+        else:
+            self._pending_pos = end
+
+    def _cancel_render(self):
+        self._render_timer.stop()
+        self._pending_lines = None
+        self._pending_pos = 0
+
+    def _scroll_output_to_bottom(self):
         sb = self.output_edit.verticalScrollBar()
         sb.setValue(sb.maximum())
 
-    def _on_output_error(self, msg: str):
-        self.output_edit.setPlainText(f"Error fetching output:\n{msg}")
+    def _on_limit_lines_toggled(self, checked: bool):
+        self.output_edit.setMaximumBlockCount(self.OUTPUT_MAX_LINES if checked else 0)
+        if not checked and self._shown_output is not None:
+            # Lines dropped by the cap are gone from the document; restore them
+            self._set_output_text(self._shown_output)
 
     # ------------------------------------------------------------------
     # Output filtering & highlighting
     # ------------------------------------------------------------------
 
-    def _filter_errors_only(self, text: str) -> str:
+    def _split_lines(self, text: str) -> list:
+        """text.splitlines(), reused while the fetched output is unchanged.
+        GUI thread only; OutputFilterThread filters split their own copy."""
+        cached_text, lines = self._split_cache
+        if text != cached_text:
+            lines = text.splitlines()
+            self._split_cache = (text, lines)
+        return lines
+
+    @classmethod
+    def _candidate_line_numbers(cls, text: str, needles: tuple):
+        """Indexes into text.splitlines() of the lines containing any of the
+        lowercase needles, case-insensitively, in ascending order.
+
+        The search runs as str.find over the whole lowered text, so only the
+        hits cost Python work, not every line. Returns None when line numbers
+        can't be derived by counting newlines (non-ASCII text, whose lower()
+        may change length, or other line breaks); callers then check every line.
+        """
+        if not text.isascii() or any(c in text for c in cls._ODD_LINE_BREAKS):
+            return None
+        if "\r" in text and text.count("\r") != text.count("\r\n"):
+            return None  # Bare \r (progress redraws) also splits lines
+        low = text.lower()
+        find, rfind = low.find, low.rfind
+        starts = set()
+        for needle in needles:
+            pos = find(needle)
+            while pos != -1:
+                starts.add(rfind("\n", 0, pos) + 1)
+                eol = find("\n", pos)
+                if eol == -1:
+                    break
+                pos = find(needle, eol)
+        numbers = []
+        line_no = prev = 0
+        for start in sorted(starts):
+            line_no += low.count("\n", prev, start)
+            prev = start
+            numbers.append(line_no)
+        return numbers
+
+    # The filters below take text.splitlines() as `lines` when the caller
+    # already has it, and split the text themselves otherwise.
+
+    @classmethod
+    def _filter_errors_only(cls, text: str, lines: Optional[list] = None) -> str:
         """Lines with Error/Traceback/Exception/CRITICAL + 2 context lines.
         Warnings are intentionally excluded — use Warnings filter separately."""
-        import re
-        pattern = re.compile(
-            r"(error|traceback|exception|fatal|critical)", re.IGNORECASE
-        )
-        lines = text.splitlines()
+        search = cls._PAT_ERRORS.search
+        if lines is None:
+            lines = text.splitlines()
+        candidates = cls._candidate_line_numbers(
+            text, ("error", "traceback", "exception", "fatal", "critical"))
+        if candidates is None:
+            candidates = range(len(lines))
         result = []
-        i = 0
-        while i < len(lines):
-            if pattern.search(lines[i]):
-                result.append(lines[i])
-                for j in range(1, 3):
-                    if i + j < len(lines):
-                        result.append(lines[i + j])
-                i += 3
-            else:
-                i += 1
+        resume = 0  # Lines before this were already shown as context
+        for i in candidates:
+            if i >= resume and search(lines[i]):
+                result.extend(lines[i:i + 3])
+                resume = i + 3
         return "\n".join(result)
 
-    def _filter_warnings_only(self, text: str) -> str:
+    @classmethod
+    def _filter_warnings_only(cls, text: str, lines: Optional[list] = None) -> str:
         """Lines containing Warning/WARN (addon warnings are noisy in Blender)."""
-        import re
-        pattern = re.compile(r"(warning|warn\b)", re.IGNORECASE)
-        return "\n".join(l for l in text.splitlines() if pattern.search(l))
-
-    def _filter_saved_files(self, text: str) -> str:
+        search = cls._PAT_WARNINGS.search
+        if lines is None:
+            lines = text.splitlines()
+        candidates = cls._candidate_line_numbers(text, ("warn",))
+        if candidates is None:
+            return "\n".join(l for l in lines if search(l))
+        return "\n".join(lines[i] for i in candidates if search(lines[i]))
+
+    @classmethod
+    def _filter_saved_files(cls, text: str, lines: Optional[list] = None) -> str:
         """Saved: lines + standalone Time: lines grouped together.
         Gives a per-frame summary: what was saved and how long it took."""
-        import re
-        time_pat = re.compile(r"^\s*Time:\s+\d+", re.IGNORECASE)
+        time_match = cls._PAT_TIME.match
+        if lines is None:
+            lines = text.splitlines()
+        candidates = cls._candidate_line_numbers(text, ("saved:", "time:"))
+        if candidates is None:
+            candidates = range(len(lines))
         result = []
-        for line in text.splitlines():
-            if line.strip().startswith("Saved:") or time_pat.match(line):
+        for i in candidates:
+            line = lines[i]
+            if line.strip().startswith("Saved:") or time_match(line):
                 result.append(line)
         return "\n".join(result)
 
-    def _filter_frame_summary(self, text: str) -> str:
+    @staticmethod
+    def _filter_frame_summary(text: str, lines: Optional[list] = None) -> str:
         """All Fra: lines — shows tile/sample progress per frame.
         Excludes Saved/Time lines so only render progress is shown."""
-        return "\n".join(
-            l for l in text.splitlines() if l.strip().startswith("Fra:")
-        )
+        if lines is None:
+            lines = text.splitlines()
+        return "\n".join(l for l in lines if l.strip().startswith("Fra:"))
 
     def _read_crash_txt(self) -> str:
         """Read crash.txt from the blend file directory if it exists."""
@@ -1884,50 +2944,37 @@ class JobLogDialog(QDialog):
         ]
         for p in candidates:
             p = os.path.normpath(p)
-            if os.path.isfile(p):
-                try:
-                    with open(p, "r", errors="replace") as f:
-                        return f"=== crash.txt ===\n{f.read()}\n=================\n\n"
-                except Exception:
-                    pass
+            try:
+                st = os.stat(p)
+            except OSError:
+                continue
+            if not stat.S_ISREG(st.st_mode):
+                continue
+            # Auto-refresh re-reads this every poll; only hit the file again
+            # when it has actually changed.
+            key = (st.st_mtime_ns, st.st_size)
+            cached = self._crash_cache.get(p)
+            if cached and cached[0] == key:
+                return cached[1]
+            try:
+                with open(p, "rb") as f:
+                    truncated = st.st_size > self.CRASH_MAX_BYTES
+                    if truncated:
+                        f.seek(-self.CRASH_MAX_BYTES, os.SEEK_END)
+                    data = f.read(self.CRASH_MAX_BYTES)
+            except Exception:
+                continue
+            body = data.decode("utf-8", errors="replace").replace("\r\n", "\n")
+            if truncated:
+                # Drop the partial first line and say what was skipped
+                body = body.partition("\n")[2]
+                body = (f"[... showing last {self.CRASH_MAX_BYTES // 1024} KiB "
+                        f"of {st.st_size // 1024} KiB ...]\n{body}")
+            text = f"=== crash.txt ===\n{body}\n=================\n\n"
+            self._crash_cache[p] = (key, text)
+            return text
         return ""
 
-    def _highlight_output(self, text: str) -> str:
-        """Convert plain text to HTML with color-coded lines."""
-        import html, re
-
-        COLOR_FRAME   = "#64b5f6"   # blue   — Fra:\d+
-        COLOR_ERROR   = "#ef5350"   # red    — Error / Traceback / CRITICAL
-        COLOR_WARN    = "#ffb300"   # amber  — Warning / WARN
-        COLOR_OK      = "#66bb6a"   # green  — Time / Mem / Finished / render
-        COLOR_CRASH   = "#ff6e40"   # orange — crash.txt header
-        COLOR_DEFAULT = "#b0b0b0"   # gray   — everything else
-
-        pat_frame   = re.compile(r"Fra:\d+", re.IGNORECASE)
-        pat_error   = re.compile(r"(error|traceback|critical)", re.IGNORECASE)
-        pat_warn    = re.compile(r"(warning|warn\b)", re.IGNORECASE)
-        pat_ok      = re.compile(r"(Time:|Mem:|Finished|render)", re.IGNORECASE)
-        pat_crash   = re.compile(r"=== crash\.txt ===", re.IGNORECASE)
-
-        parts = ['<pre style="margin:0;padding:0;font-family:monospace;font-size:9pt;">']
-        for line in text.splitlines():
-            escaped = html.escape(line)
-            if pat_crash.search(line):
-                color = COLOR_CRASH
-            elif pat_error.search(line):
-                color = COLOR_ERROR
-            elif pat_warn.search(line):
-                color = COLOR_WARN
-            elif pat_frame.search(line):
-                color = COLOR_FRAME
-            elif pat_ok.search(line):
-                color = COLOR_OK
-            else:
-                color = COLOR_DEFAULT
-            parts.append(f'<span style="color:{color}">{escaped}</span>')
-        parts.append("</pre>")
-        return "\n".join(parts)
-
     # ------------------------------------------------------------------
     # Find / Copy / Save
     # ------------------------------------------------------------------
@@ -1965,42 +3012,56 @@ class JobLogDialog(QDialog):
 
     def _toggle_auto_refresh(self, state: int):
         if state == Qt.CheckState.Checked.value:
+            self._reset_refresh_backoff()
             self._refresh_timer.start()
         else:
             self._refresh_timer.stop()
 
-    def _cleanup_finished_threads(self):
-        """Remove finished threads from _refresh_threads list."""
-        self._refresh_threads = [t for t in self._refresh_threads if t.isRunning()]
+    def _reset_refresh_backoff(self):
+        self._last_status = None
+        if self._refresh_timer.interval() != self.REFRESH_INTERVAL_MS:
+            self._refresh_timer.setInterval(self.REFRESH_INTERVAL_MS)  # restarts it
 
     def _refresh(self):
         """Re-fetch job info and task output."""
         if not self._current_job_id:
             return
-        
-        # Clean up any finished threads
-        self._cleanup_finished_threads()
-        
+        if self._refresh_in_flight:
+            return  # Previous refresh still running (slow farm): skip this tick
+
         # Refresh job info silently
-        info_thread = JobFetchThread(self._current_job_id, "job_info")
-        info_thread.job_loaded.connect(self._on_job_loaded)
-        info_thread.finished.connect(self._cleanup_finished_threads)
-        info_thread.start()
-        self._refresh_threads.append(info_thread)  # Keep reference to prevent garbage collection
+        signals = self._refresh_signals()
+        signals.job_loaded.connect(self._on_job_loaded)
+        self._refresh_pool.start(JobFetchTask(signals, self._current_job_id, "job_info"))
 
         # Refresh current output if a block is selected
-        block_name = self.scene_combo.currentText()
-        info = self._scene_layer_map.get(block_name)
+        info = self._current_block_info
         if info:
             block_num, _ = info
             task_num = self.task_spin.value()
-            out_thread = JobFetchThread(self._current_job_id, "task_output",
-                                        block_num=block_num, task_num=task_num)
-            out_thread.output_loaded.connect(self._on_output_loaded)
-            out_thread.error.connect(self._on_output_error)
-            out_thread.finished.connect(self._cleanup_finished_threads)
-            out_thread.start()
-            self._refresh_threads.append(out_thread)  # Keep reference to prevent garbage collection
+            signals = self._refresh_signals()
+            signals.output_loaded.connect(self._on_output_loaded)
+            signals.error.connect(self._on_output_error)
+            self._refresh_pool.start(JobFetchTask(signals, self._current_job_id, "task_output",
+                                                  block_num=block_num, task_num=task_num))
+
+    def _refresh_signals(self) -> JobFetchSignals:
+        """Signals for one refresh task, counted in-flight until it is done.
+        Connect the result slots before handing it to the pool."""
+        signals = JobFetchSignals(self)
+        signals.done.connect(self._on_refresh_task_done)
+        signals.done.connect(signals.deleteLater)
+        self._refresh_in_flight += 1
+        return signals
+
+    def _on_refresh_task_done(self):
+        self._refresh_in_flight -= 1
+
+    def showEvent(self, event):
+        # Dialog is reused across opens; resume polling if it was left enabled
+        if self.auto_refresh_check.isChecked():
+            self._refresh_timer.start()
+        super().showEvent(event)
 
     def closeEvent(self, event):
         self._refresh_timer.stop()
@@ -2011,18 +3072,154 @@ class JobLogDialog(QDialog):
 # Farm Overview / Job Stats Panel
 # ---------------------------------------------------------------------------
 
+class JobListModel(QAbstractListModel):
+    """Job entries found by a Job Stats scan, one row per (job name, ID).
+
+    Rows are filled in one reset instead of one widget item per job, and a
+    job ID → row map lets state colour updates touch just their row.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._labels = []
+        self._job_ids = []   # int, or None for IDs that aren't numeric
+        self._colors = []    # QColor or None (default palette)
+        self._rows = {}      # job_id -> first row showing it
+
+    def set_entries(self, entries: list):
+        """Replace all rows from (job_name, job_id_str) pairs."""
+        self.beginResetModel()
+        self._labels = [f"{job_name}  [{job_id_str}]" for job_name, job_id_str in entries]
+        self._job_ids = [int(job_id_str) if job_id_str.isdigit() else None
+                         for _, job_id_str in entries]
+        self._colors = [None] * len(entries)
+        self._rows = {}
+        for row, job_id in enumerate(self._job_ids):
+            if job_id is not None:
+                self._rows.setdefault(job_id, row)
+        self.endResetModel()
+
+    def set_job_color(self, job_id: int, color: QColor):
+        row = self._rows.get(job_id)
+        if row is None or self._colors[row] == color:
+            return
+        self._colors[row] = color
+        index = self.index(row, 0)
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.ForegroundRole])
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._labels)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._labels[row]
+        if role == Qt.ItemDataRole.UserRole:
+            return self._job_ids[row]
+        if role == Qt.ItemDataRole.ForegroundRole:
+            return self._colors[row]
+        return None
+
+
+class BlocksModel(QAbstractTableModel):
+    """Per-block rows of the Job Stats "Block Details" table.
+
+    Rows are tuples of display strings; the view asks for the cells it
+    paints, so a refresh creates no per-cell objects.
+    """
+
+    HEADERS = ("Block", "Tasks", "Done", "Running", "Error", "Avg Render", "ETA")
+    # Widest typical cell text per column, used to size columns up front
+    # instead of measuring every row (ResizeToContents)
+    WIDTH_SAMPLES = ("", "99999", "99999", "99999", "99999", "00h 00m 00s", "00h 00m 00s")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+
+    def set_rows(self, rows: list):
+        """Replace all rows with tuples of len(HEADERS) strings.
+
+        Reconciles against the current rows: only the row-count difference is
+        inserted/removed and only rows whose text changed are repainted, so a
+        steady-state refresh keeps the view's scroll and selection untouched.
+        """
+        old = self._rows
+        if rows == old:
+            return
+        n_old, n_new = len(old), len(rows)
+        if n_new < n_old:
+            self.beginRemoveRows(QModelIndex(), n_new, n_old - 1)
+            self._rows = rows
+            self.endRemoveRows()
+        elif n_new > n_old:
+            self.beginInsertRows(QModelIndex(), n_old, n_new - 1)
+            self._rows = rows
+            self.endInsertRows()
+        else:
+            self._rows = rows
+        changed = [r for r in range(min(n_old, n_new)) if old[r] != rows[r]]
+        if changed:
+            self.dataChanged.emit(
+                self.index(changed[0], 0),
+                self.index(changed[-1], len(self.HEADERS) - 1),
+                [Qt.ItemDataRole.DisplayRole],
+            )
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._rows[index.row()][index.column()]
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return Qt.AlignmentFlag.AlignCenter
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+
 class JobStatsPanel(QDialog):
     """Dialog for viewing per-job render statistics for a directory or blend file.
 
     User flow:
         1. Enter/browse a directory OR a single .blend file path
         2. Click "Scan" to auto-detect all job IDs from job_id/ subfolder
-        3. Select a job from the left-hand QListWidget
+        3. Select a job from the left-hand job list
         4. Stats are fetched from Afanasy and displayed:
            - Progress bar + ETA in summary section
            - Per-block timings in a table
         5. Optionally enable auto-refresh (10 s interval)
     """
+    # How long incoming stats are collected before the UI is updated
+    STATS_FLUSH_MS = 100
+    # Selection must rest this long before an uncached job is fetched
+    SELECT_DEBOUNCE_MS = 150
+    # Concurrent get_job_stats() requests
+    FETCH_THREADS = 4
+
+    # State colour: first token found in the upper-cased state string wins
+    _STATE_TOKENS = (
+        ("DONE", "#66bb6a"),
+        ("ERROR", "#ef5350"),
+        ("RUN", "#64b5f6"),
+        ("WAIT", "#ffb300"),
+        ("READY", "#ffb300"),
+    )
+    _STATE_COLOR_DEFAULT = "#b0b0b0"
+    # Farm state strings repeat on every poll; resolve each one once
+    _STATE_COLORS: dict = {}    # state -> hex colour
+    _STATE_QCOLORS: dict = {}   # state -> QColor for the job list
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -2030,13 +3227,29 @@ class JobStatsPanel(QDialog):
         self.resize(960, 580)
         self.setMinimumSize(700, 450)
         self._stats_cache: dict = {}
-        self._fetch_threads: list = []
-        self._refresh_threads: list = []
+        self._fetch_pool = QThreadPool(self)  # shared by selection and refresh fetches
+        self._fetch_pool.setMaxThreadCount(self.FETCH_THREADS)
         self._current_job_id = None
         self._job_entries: list = []
+        self._valid_job_ids: list = []  # distinct numeric IDs in _job_entries, for refresh
+        self._rendered_stats = None     # stats dict the detail pane currently shows
+        self._prefill_files: list = []  # file list last passed to populate_files
         self._refresh_timer = QTimer(self)
         self._refresh_timer.setInterval(10_000)
         self._refresh_timer.timeout.connect(self._refresh)
+        # Stats that arrived since the last flush, job_id -> data; applied
+        # together so a burst of refresh replies paints once
+        self._pending_updates: dict = {}
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.STATS_FLUSH_MS)
+        self._flush_timer.timeout.connect(self._flush_pending)
+        self._select_timer = QTimer(self)
+        self._select_timer.setSingleShot(True)
+        self._select_timer.setInterval(self.SELECT_DEBOUNCE_MS)
+        self._select_timer.timeout.connect(self._fetch_current)
+        self._inflight: set = set()  # job IDs with a fetch queued or running
+        self._refresh_in_flight = 0  # refresh tasks not yet finished
         self._build_ui()
 
     # ------------------------------------------------------------------
@@ -2093,10 +3306,13 @@ class JobStatsPanel(QDialog):
         left_layout = QVBoxLayout(left_widget)
         left_layout.setContentsMargins(0, 0, 4, 0)
         left_layout.addWidget(QLabel("Jobs Found:"))
-        self.job_list = QListWidget()
+        self.job_model = JobListModel(self)
+        self.job_list = QListView()
+        self.job_list.setModel(self.job_model)
+        self.job_list.setUniformItemSizes(True)
         self.job_list.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
         self.job_list.setMinimumWidth(200)
-        self.job_list.currentItemChanged.connect(self._on_job_selected)
+        self.job_list.selectionModel().currentChanged.connect(self._on_job_selected)
         left_layout.addWidget(self.job_list, 1)
         splitter.addWidget(left_widget)
 
@@ -2135,17 +3351,24 @@ class JobStatsPanel(QDialog):
         # Block details group
         blocks_group = QGroupBox("Block Details")
         blocks_layout = QVBoxLayout(blocks_group)
-        self.blocks_table = QTableWidget(0, 7)
-        self.blocks_table.setHorizontalHeaderLabels(
-            ["Block", "Tasks", "Done", "Running", "Error", "Avg Render", "ETA"]
-        )
+        self.blocks_model = BlocksModel(self)
+        self.blocks_table = QTableView()
+        self.blocks_table.setModel(self.blocks_model)
         self.blocks_table.setAlternatingRowColors(True)
         self.blocks_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self.blocks_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.blocks_table.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.blocks_table.setHorizontalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
         hh = self.blocks_table.horizontalHeader()
         hh.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
-        for col in range(1, 7):
-            hh.setSectionResizeMode(col, QHeaderView.ResizeMode.ResizeToContents)
+        fm = self.blocks_table.fontMetrics()
+        for col in range(1, len(BlocksModel.HEADERS)):
+            hh.setSectionResizeMode(col, QHeaderView.ResizeMode.Interactive)
+            width = max(fm.horizontalAdvance(BlocksModel.HEADERS[col]),
+                        fm.horizontalAdvance(BlocksModel.WIDTH_SAMPLES[col]))
+            hh.resizeSection(col, width + 24)
+        # Every row is one line of text; don't measure rows individually
+        self.blocks_table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
         blocks_layout.addWidget(self.blocks_table)
         right_layout.addWidget(blocks_group, 1)
 
@@ -2169,6 +3392,9 @@ class JobStatsPanel(QDialog):
 
     def populate_files(self, blend_files: list):
         """Pre-fill path from the first file's directory (called by MainWindow)."""
+        if blend_files == self._prefill_files:
+            return  # reopened with the same scan; keep whatever the user typed
+        self._prefill_files = blend_files
         if blend_files:
             self.path_edit.setText(os.path.dirname(blend_files[0]))
 
@@ -2196,7 +3422,7 @@ class JobStatsPanel(QDialog):
         raw = self.path_edit.text().strip()
         if not raw:
             return
-        if os.path.isfile(raw) and raw.endswith(".blend"):
+        if os.path.isfile(raw) and raw.lower().endswith(".blend"):
             directory = os.path.dirname(raw)
         elif os.path.isdir(raw):
             directory = raw
@@ -2209,7 +3435,19 @@ class JobStatsPanel(QDialog):
 
     def _populate_job_list(self, entries: list):
         self._job_entries = entries
-        self.job_list.clear()
+        self._valid_job_ids = list(dict.fromkeys(
+            int(job_id_str) for _, job_id_str in entries if job_id_str.isdigit()
+        ))
+        # Reset, re-colour and deselect in one paint
+        self.job_list.setUpdatesEnabled(False)
+        try:
+            self.job_model.set_entries(entries)
+            # Jobs seen before keep their state colour without waiting for a fetch
+            for job_id, data in self._stats_cache.items():
+                self._update_list_item_state(job_id, str(data.get("state", "")))
+            self.job_list.setCurrentIndex(QModelIndex())  # no auto-select; user picks explicitly
+        finally:
+            self.job_list.setUpdatesEnabled(True)
         if not entries:
             self.no_jobs_label.setText(
                 "No job IDs found. Submit jobs first or check that a job_id/ subfolder exists."
@@ -2217,18 +3455,13 @@ class JobStatsPanel(QDialog):
             self.no_jobs_label.setVisible(True)
             return
         self.no_jobs_label.setVisible(False)
-        for job_name, job_id_str in entries:
-            item = QListWidgetItem(f"{job_name}  [{job_id_str}]")
-            item.setData(Qt.ItemDataRole.UserRole, int(job_id_str) if job_id_str.isdigit() else None)
-            self.job_list.addItem(item)
-        self.job_list.setCurrentRow(-1)  # no auto-select; user picks explicitly
 
     # ------------------------------------------------------------------
     # Job selection & fetching
     # ------------------------------------------------------------------
 
-    def _on_job_selected(self, current: QListWidgetItem, previous: QListWidgetItem):
-        if current is None:
+    def _on_job_selected(self, current: QModelIndex, previous: QModelIndex):
+        if not current.isValid():
             return
         job_id = current.data(Qt.ItemDataRole.UserRole)
         if job_id is None:
@@ -2236,32 +3469,65 @@ class JobStatsPanel(QDialog):
             return
         self._current_job_id = job_id
         if job_id in self._stats_cache:
+            self._select_timer.stop()
             self._render_stats(self._stats_cache[job_id])
         else:
+            # Arrow-keying through the list: only fetch where the user stops
+            self._select_timer.start()
+
+    def _fetch_current(self):
+        job_id = self._current_job_id
+        if job_id is not None and job_id not in self._stats_cache:
             self._fetch_stats(job_id)
 
     def _fetch_stats(self, job_id: int):
         self.status_label.setText("Loading…")
         self.error_label.setVisible(False)
-        thread = JobStatsFetchThread(job_id)
-        thread.stats_loaded.connect(self._on_stats_loaded)
-        thread.error.connect(self._on_stats_error)
-        thread.finished.connect(self._cleanup_threads)
-        thread.start()
-        self._fetch_threads.append(thread)
-
+        if job_id in self._inflight:
+            return  # a refresh is already fetching it; its reply will render
+        signals = self._fetch_signals([job_id])
+        signals.stats_loaded.connect(self._on_stats_loaded)
+        signals.error.connect(self._on_stats_error)
+        self._fetch_pool.start(JobStatsFetchTask(signals, [job_id]))
+
+    def _fetch_signals(self, job_ids: list) -> JobStatsFetchSignals:
+        """Signals for one fetch task, each job marked in flight until its
+        own reply. Connect the result slots before handing it to the pool."""
+        self._inflight.update(job_ids)
+        signals = JobStatsFetchSignals(self)
+        signals.job_done.connect(self._inflight.discard)
+        signals.done.connect(signals.deleteLater)
+        return signals
+
+    # Connected afresh for every fetch task: declared slots let PyQt bind
+    # them by signature instead of wrapping the bound method each time.
+    @pyqtSlot(dict)
     def _on_stats_loaded(self, data: dict):
-        import datetime
         job_id = data.get("job_id")
         self._stats_cache[job_id] = data
-        self._update_list_item_state(job_id, str(data.get("state", "")))
-        if job_id == self._current_job_id:
-            self._render_stats(data)
-        self.status_label.setText(
-            f"Updated: {datetime.datetime.now().strftime('%H:%M:%S')}"
-        )
+        self._pending_updates[job_id] = data
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
 
-    def _on_stats_error(self, msg: str):
+    def _flush_pending(self):
+        pending, self._pending_updates = self._pending_updates, {}
+        if not pending:
+            return
+        self.job_list.setUpdatesEnabled(False)
+        for job_id, data in pending.items():
+            self._update_list_item_state(job_id, str(data.get("state", "")))
+        self.job_list.setUpdatesEnabled(True)
+        current = pending.get(self._current_job_id)
+        if current is not None:
+            self._render_stats(current)
+        status = f"Updated: {time.strftime('%H:%M:%S')}"
+        if self.status_label.text() != status:
+            self.status_label.setText(status)
+
+    @pyqtSlot(int, str)
+    def _on_stats_error(self, job_id: int, msg: str):
+        if job_id != self._current_job_id:
+            return  # the user has moved on to another job
         self.error_label.setText(msg)
         self.error_label.setVisible(True)
         self.status_label.setText("Error fetching stats")
@@ -2272,6 +3538,9 @@ class JobStatsPanel(QDialog):
 
     def _render_stats(self, data: dict):
         self.error_label.setVisible(False)
+        if data == self._rendered_stats:
+            return  # Idle job: same reply as the one on screen
+        self._rendered_stats = data
 
         # Summary
         self.job_name_label.setText(
@@ -2297,13 +3566,10 @@ class JobStatsPanel(QDialog):
         self.eta_label.setText(f"{s.get('overall_eta_formatted', '—')}")
 
         # Blocks table
-        blocks = data.get("blocks", [])
-        self.blocks_table.setRowCount(0)
-        for block in blocks:
-            row = self.blocks_table.rowCount()
-            self.blocks_table.insertRow(row)
+        rows = []
+        for block in data.get("blocks", []):
             rt = block.get("render_timings", {})
-            cells = [
+            rows.append((
                 block.get("name", "—"),
                 str(block.get("tasks_num", "—")),
                 str(block.get("p_tasks_done", "—")),
@@ -2311,31 +3577,23 @@ class JobStatsPanel(QDialog):
                 str(block.get("p_tasks_error", "—")),
                 rt.get("avg_formatted", "—"),
                 block.get("eta_formatted", "—"),
-            ]
-            for col, text in enumerate(cells):
-                item = QTableWidgetItem(text)
-                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                self.blocks_table.setItem(row, col, item)
+            ))
+        self.blocks_model.set_rows(rows)
 
     def _state_color(self, state: str) -> str:
-        s = state.upper()
-        if "DONE" in s:
-            return "#66bb6a"
-        if "ERROR" in s:
-            return "#ef5350"
-        if "RUN" in s:
-            return "#64b5f6"
-        if "WAIT" in s or "READY" in s:
-            return "#ffb300"
-        return "#b0b0b0"
+        color = self._STATE_COLORS.get(state)
+        if color is None:
+            s = state.upper()
+            color = next((c for token, c in self._STATE_TOKENS if token in s),
+                         self._STATE_COLOR_DEFAULT)
+            self._STATE_COLORS[state] = color
+        return color
 
     def _update_list_item_state(self, job_id: int, state: str):
-        color = self._state_color(state)
-        for i in range(self.job_list.count()):
-            item = self.job_list.item(i)
-            if item and item.data(Qt.ItemDataRole.UserRole) == job_id:
-                item.setForeground(QColor(color))
-                break
+        qcolor = self._STATE_QCOLORS.get(state)
+        if qcolor is None:
+            qcolor = self._STATE_QCOLORS[state] = QColor(self._state_color(state))
+        self.job_model.set_job_color(job_id, qcolor)
 
     # ------------------------------------------------------------------
     # Auto-refresh
@@ -2348,24 +3606,43 @@ class JobStatsPanel(QDialog):
             self._refresh_timer.stop()
 
     def _refresh(self):
-        for job_name, job_id_str in self._job_entries:
-            if not job_id_str.isdigit():
-                continue
-            job_id = int(job_id_str)
-            thread = JobStatsFetchThread(job_id)
-            thread.stats_loaded.connect(self._on_stats_loaded)
-            thread.finished.connect(self._cleanup_threads)
-            thread.start()
-            self._refresh_threads.append(thread)
-
-    def _cleanup_threads(self):
-        self._fetch_threads = [t for t in self._fetch_threads if t.isRunning()]
-        self._refresh_threads = [t for t in self._refresh_threads if t.isRunning()]
+        # A few tasks each walk a share of the jobs instead of a fetch per job.
+        # They never take more than FETCH_THREADS - 1 threads, so a job the
+        # user selects always has one free; jobs whose previous fetch is still
+        # running (slow farm) are skipped.
+        free = self.FETCH_THREADS - 1 - self._refresh_in_flight
+        inflight = self._inflight
+        job_ids = [job_id for job_id in self._valid_job_ids if job_id not in inflight]
+        tasks = min(free, len(job_ids))
+        for i in range(tasks):
+            chunk = job_ids[i::tasks]
+            signals = self._fetch_signals(chunk)
+            signals.stats_loaded.connect(self._on_stats_loaded)
+            signals.error.connect(self._on_refresh_error)
+            signals.done.connect(self._on_refresh_task_done)
+            self._refresh_in_flight += 1
+            self._fetch_pool.start(JobStatsFetchTask(signals, chunk))
+
+    def _on_refresh_task_done(self):
+        self._refresh_in_flight -= 1
+
+    @pyqtSlot(int, str)
+    def _on_refresh_error(self, job_id: int, msg: str):
+        # Refresh failures stay quiet, except for a selected job that has
+        # nothing on screen yet: _fetch_stats left it on "Loading…" for us.
+        if job_id == self._current_job_id and job_id not in self._stats_cache:
+            self._on_stats_error(job_id, msg)
 
     # ------------------------------------------------------------------
     # Close
     # ------------------------------------------------------------------
 
+    def showEvent(self, event):
+        # Dialog is reused across opens; resume polling if it was left enabled
+        if self.auto_refresh_check.isChecked():
+            self._refresh_timer.start()
+        super().showEvent(event)
+
     def closeEvent(self, event):
         self._refresh_timer.stop()
         super().closeEvent(event)
@@ -2376,8 +3653,16 @@ class JobStatsPanel(QDialog):
 # ---------------------------------------------------------------------------
 
 class SubmissionPanel(QWidget):
+    # Messages arriving within this window are appended to the log in one go
+    LOG_FLUSH_MS = 50
+
     def __init__(self):
         super().__init__()
+        self._pending_log = []
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(self.LOG_FLUSH_MS)
+        self._log_flush_timer.timeout.connect(self._flush_log)
         self._build_ui()
 
     def _build_ui(self):
@@ -2432,12 +3717,23 @@ class SubmissionPanel(QWidget):
 
     def log_message(self, msg: str, error: bool = False):
         color = "#ef5350" if error else "#b0b0b0"
-        self.log.append(f'<span style="color:{color}">&gt; {msg}</span>')
+        self._pending_log.append(f'<span style="color:{color}">&gt; {msg}</span>')
+        # A batch submission emits a message per file; coalesce them so the
+        # document is appended to (and relaid out) once per flush window.
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+
+    def _flush_log(self):
+        if not self._pending_log:
+            return
+        self.log.append("<br>".join(self._pending_log))
+        self._pending_log.clear()
         # Scroll to bottom
         scrollbar = self.log.verticalScrollBar()
         scrollbar.setValue(scrollbar.maximum())
 
     def clear_log(self):
+        self._pending_log.clear()
         self.log.clear()
 
 
@@ -2467,6 +3763,9 @@ class MainWindow(QMainWindow):
         self.submit_thread = None
         self._job_log_dialog = None  # Persistent reference to prevent garbage collection
         self._job_stats_panel = None  # Persistent reference for JobStatsPanel
+        self._inspect_cache = InspectionCache(os.path.join(
+            QStandardPaths.writableLocation(QStandardPaths.StandardLocation.AppDataLocation),
+            "inspect_cache.json"))
 
         self._build_ui()
         self._load_settings()
@@ -2525,7 +3824,7 @@ class MainWindow(QMainWindow):
         settings = QSettings("MonstaStudios", "BatchSubmitter")
         self.file_panel.dir_edit.setText(settings.value("last_directory", ""))
         self.app_tab.blender_edit.setText(
-            settings.value("blender_path", config.SETTINGS.get("BLENDER_PATH", ""))
+            settings.value("blender_path", config.BLENDER_PATH)
         )
         self.job_tab.priority_spin.setValue(int(settings.value("default_priority", 99)))
         self.render_tab.fpt_spin.setValue(int(settings.value("default_fpt", 3)))
@@ -2556,32 +3855,24 @@ class MainWindow(QMainWindow):
     # --- Job Log Viewer ---
 
     def _open_job_stats(self):
-        if self._job_stats_panel is not None:
-            try:
-                self._job_stats_panel.close()
-            except RuntimeError:
-                pass
-        self._job_stats_panel = JobStatsPanel(self)
-        self._job_stats_panel.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose, True)
-        self._job_stats_panel.destroyed.connect(
-            lambda: setattr(self, '_job_stats_panel', None)
-        )
+        # Build the dialog once and re-show it; rebuilding its widget tree on
+        # every open is wasted work and loses the user's scan/selection.
+        if self._job_stats_panel is None:
+            self._job_stats_panel = JobStatsPanel(self)
         self._job_stats_panel.populate_files(self.file_panel.get_all_filepaths())
-        self._job_stats_panel.show()
+        self._show_dialog(self._job_stats_panel)
 
     def _open_job_log(self):
-        if self._job_log_dialog is not None:
-            try:
-                self._job_log_dialog.close()
-            except RuntimeError:
-                pass
-        self._job_log_dialog = JobLogDialog(self)
-        self._job_log_dialog.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose, True)
-        self._job_log_dialog.destroyed.connect(
-            lambda: setattr(self, '_job_log_dialog', None)
-        )
+        if self._job_log_dialog is None:
+            self._job_log_dialog = JobLogDialog(self)
         self._job_log_dialog.populate_files(self.file_panel.get_all_filepaths())
-        self._job_log_dialog.show()
+        self._show_dialog(self._job_log_dialog)
+
+    @staticmethod
+    def _show_dialog(dialog: QDialog):
+        dialog.show()
+        dialog.raise_()
+        dialog.activateWindow()
 
     # --- File selection ---
 
@@ -2597,7 +3888,7 @@ class MainWindow(QMainWindow):
         if filepath not in self.file_data:
             self.file_data[filepath] = BlendFileData(
                 filepath=filepath,
-                job_name=os.path.basename(filepath).replace(".blend", ""),
+                job_name=job_name_for(filepath),
             )
 
         fd = self.file_data[filepath]
@@ -2663,11 +3954,9 @@ class MainWindow(QMainWindow):
     def _run_inspection(self, files: list):
         """Common inspection logic for both Inspect Selected and Inspect All."""
         blender = self._get_blender_path()
-        inspector_script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "blend_inspector.py")
 
         # Mark all as inspecting
-        for f in files:
-            self.file_panel.set_row_status(f, "Inspecting...")
+        self.file_panel.set_rows_status(files, "Inspecting...")
 
         # Disable both buttons during inspection
         self.file_panel.inspect_selected_btn.setEnabled(False)
@@ -2675,7 +3964,8 @@ class MainWindow(QMainWindow):
         self.file_panel.inspect_all_btn.setEnabled(False)
         self.file_panel.inspect_all_btn.setText("Inspecting...")
 
-        self.inspector_thread = InspectorThread(files, blender, inspector_script)
+        self.inspector_thread = InspectorThread(files, blender, _INSPECTOR_SCRIPT,
+                                                cache=self._inspect_cache)
         self.inspector_thread.file_inspected.connect(self._on_file_inspected)
         self.inspector_thread.all_done.connect(self._on_inspect_done)
         self.inspector_thread.start()
@@ -2705,7 +3995,7 @@ class MainWindow(QMainWindow):
 
         fd = BlendFileData(
             filepath=filepath,
-            job_name=metadata.get("job_name", os.path.basename(filepath).replace(".blend", "")),
+            job_name=metadata.get("job_name", job_name_for(filepath)),
             inspected=True,
             scenes=scenes,
             selected_scene=first_scene.get("name", ""),
@@ -2794,12 +4084,12 @@ class MainWindow(QMainWindow):
             if filepath not in self.file_data:
                 self.file_data[filepath] = BlendFileData(
                     filepath=filepath,
-                    job_name=os.path.basename(filepath).replace(".blend", ""),
+                    job_name=job_name_for(filepath),
                 )
             fd = self.file_data[filepath]
             # If no job name override, use the file-based one
             if not fd.job_name:
-                fd.job_name = os.path.basename(filepath).replace(".blend", "")
+                fd.job_name = job_name_for(filepath)
             jobs.append((filepath, fd, job_settings))
 
         # Show submission summary
@@ -2900,6 +4190,9 @@ def _apply_dark_palette(app: QApplication):
 
 def main():
     app = QApplication(sys.argv)
+    # Same names as the QSettings store; also places the AppData cache dir
+    app.setOrganizationName("MonstaStudios")
+    app.setApplicationName("BatchSubmitter")
     app.setStyle("Fusion")
     _apply_dark_palette(app)
 
@@ -2909,4 +4202,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # Frozen builds: let a spawned parse worker run instead of a second GUI
+    multiprocessing.freeze_support()
     main()